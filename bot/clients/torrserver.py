@@ -19,6 +19,7 @@ import base64
 import json
 import re
 import time
+from operator import attrgetter
 from pathlib import PurePosixPath
 from typing import Any, Optional
 from urllib.parse import quote
@@ -301,7 +302,7 @@ class TorrServerClient(BaseAPIClient):
                 year=_as_int(item.get("Year") or None, None),
             ))
 
-        releases.sort(key=lambda r: r.seeders, reverse=True)
+        releases.sort(key=attrgetter("seeders"), reverse=True)
         return releases[:limit]
 
     async def get_stats(self) -> TorrServerStats:
@@ -614,7 +614,7 @@ async def handle_close(callback: CallbackQuery) -> None:
     await callback.answer()
 
 
-@router.callback_query(F.data == f"{CallbackData.TORRENT_FILTER}menu")
+@router.callback_query(F.data == CallbackData.TORRENT_FILTER_MENU)
 async def handle_filter_menu(callback: CallbackQuery) -> None:
     """Show filter selection menu."""
     message = accessible_message(callback)
@@ -3,6 +3,7 @@
 import re
 from datetime import datetime, timezone
 from enum import Enum
+from operator import attrgetter
 from typing import Annotated, Any, ClassVar, Literal, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, field_validator
@@ -169,6 +170,26 @@ class SearchResult(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+def _normalize_ratings(v: Any) -> dict[str, float]:
+    """Normalize a raw `ratings` payload to `{source: number}`.
+
+    Every producer yields a bare number today — TMDb's `vote_average`, and
+    `LidarrClient` unwraps Lidarr's `{"value": …}` itself — but a nested
+    `{"value": x}` is still accepted in case a payload slips through unwrapped.
+    Flattening once at parse time keeps `Formatters._get_rating` a plain
+    lookup; non-numeric entries are dropped rather than failing the model.
+    """
+    if not isinstance(v, dict):
+        return {}
+    flat = {}
+    for source, value in v.items():
+        if isinstance(value, dict):
+            value = value.get("value")
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[source] = value
+    return flat
+
+
 class MovieInfo(BaseModel):
     """Movie information from a Scryer metadata search or catalog entry."""
 
@@ -188,7 +209,7 @@ class MovieInfo(BaseModel):
     genres: list[str] = Field(default_factory=list)
     poster_url: Optional[str] = Field(default=None)
     fanart_url: Optional[str] = Field(default=None)
-    ratings: dict[str, Any] = Field(default_factory=dict)
+    ratings: dict[str, float] = Field(default_factory=dict)
 
     # Scryer-specific
     scryer_id: Optional[str] = Field(default=None, description="Title id in Scryer if already in the catalog")
@@ -203,6 +224,12 @@ class MovieInfo(BaseModel):
     quality_profile_id: Optional[str] = Field(default=None)
     root_folder_path: Optional[str] = Field(default=None)
 
+    @field_validator("ratings", mode="before")
+    @classmethod
+    def _flatten_ratings(cls, v):
+        """Flatten `ratings` to `{source: number}` (see `_normalize_ratings`)."""
+        return _normalize_ratings(v)
+
 
 class SeriesInfo(BaseModel):
     """Series (or anime) information from Scryer.
@@ -226,7 +253,7 @@ class SeriesInfo(BaseModel):
     genres: list[str] = Field(default_factory=list)
     poster_url: Optional[str] = Field(default=None)
     fanart_url: Optional[str] = Field(default=None)
-    ratings: dict[str, Any] = Field(default_factory=dict)
+    ratings: dict[str, float] = Field(default_factory=dict)
     season_count: int = Field(default=0)
     total_episode_count: int = Field(default=0)
 
@@ -246,6 +273,12 @@ class SeriesInfo(BaseModel):
     root_folder_path: Optional[str] = Field(default=None)
     seasons: list[dict[str, Any]] = Field(default_factory=list)
 
+    @field_validator("ratings", mode="before")
+    @classmethod
+    def _flatten_ratings(cls, v):
+        """Flatten `ratings` to `{source: number}` (see `_normalize_ratings`)."""
+        return _normalize_ratings(v)
+
     @property
     def content_type(self) -> ContentType:
         """The ContentType matching this title's Scryer facet."""
@@ -266,7 +299,7 @@ class ArtistInfo(BaseModel):
     genres: list[str] = Field(default_factory=list)
     poster_url: Optional[str] = Field(default=None)
     fanart_url: Optional[str] = Field(default=None)
-    ratings: dict[str, Any] = Field(default_factory=dict)
+    ratings: dict[str, float] = Field(default_factory=dict)
 
     album_count: int = Field(default=0)
     track_count: int = Field(default=0)
@@ -277,6 +310,12 @@ class ArtistInfo(BaseModel):
     metadata_profile_id: Optional[int] = Field(default=None)
     root_folder_path: Optional[str] = Field(default=None)
 
+    @field_validator("ratings", mode="before")
+    @classmethod
+    def _flatten_ratings(cls, v):
+        """Flatten `ratings` to `{source: number}` (see `_normalize_ratings`)."""
+        return _normalize_ratings(v)
+
 
 class MetadataProfile(BaseModel):
     """Lidarr metadata profile (controls what album types are grabbed)."""
@@ -748,6 +787,22 @@ class TorrentFilter(str, Enum):
     ERRORED = "errored"
 
 
+# Built once at import instead of as a dict literal on every `state_emoji`
+# read (once per torrent per list/details render).
+_TORRENT_STATE_EMOJI: dict[TorrentState, str] = {
+    TorrentState.DOWNLOADING: "⬇️",
+    TorrentState.SEEDING: "⬆️",
+    TorrentState.PAUSED: "⏸️",
+    TorrentState.QUEUED: "⏳",
+    TorrentState.STALLED: "⚠️",
+    TorrentState.CHECKING: "🔍",
+    TorrentState.ERROR: "❌",
+    TorrentState.COMPLETED: "✅",
+    TorrentState.MOVING: "📦",
+    TorrentState.UNKNOWN: "❓",
+}
+
+
 class TorrentInfo(BaseModel):
     """Information about a torrent."""
 
@@ -821,18 +876,7 @@ class TorrentInfo(BaseModel):
     @property
     def state_emoji(self) -> str:
         """Get emoji for current state."""
-        return {
-            TorrentState.DOWNLOADING: "⬇️",
-            TorrentState.SEEDING: "⬆️",
-            TorrentState.PAUSED: "⏸️",
-            TorrentState.QUEUED: "⏳",
-            TorrentState.STALLED: "⚠️",
-            TorrentState.CHECKING: "🔍",
-            TorrentState.ERROR: "❌",
-            TorrentState.COMPLETED: "✅",
-            TorrentState.MOVING: "📦",
-            TorrentState.UNKNOWN: "❓",
-        }.get(self.state, "❓")
+        return _TORRENT_STATE_EMOJI.get(self.state, "❓")
 
 
 class QBittorrentStatus(BaseModel):
@@ -985,7 +1029,7 @@ class TorrServerTorrent(BaseModel):
     def video_files(self) -> list[TorrServerFile]:
         """Playable files, largest first."""
         videos = [f for f in self.files if f.path.lower().endswith(VIDEO_FILE_EXTENSIONS)]
-        return sorted(videos, key=lambda f: f.length, reverse=True)
+        return sorted(videos, key=attrgetter("length"), reverse=True)
 
 
 class TorrServerStats(BaseModel):
@@ -1,15 +1,30 @@
 """Release scoring service."""
 
 import re
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
 from typing import Optional
 
 from bot.models import ContentType, SearchResult
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScoringWeights:
-    """Configurable scoring weights."""
+    """Configurable scoring weights.
+
+    Frozen + slotted: the handlers share one ScoringService (and so one
+    weights instance) for the life of the process, and calculate_score reads
+    ~40 of its attributes per release — slot loads instead of instance-dict
+    lookups. Being immutable also keeps the precompiled patterns below from
+    drifting out of sync with the values they were built from; build a new
+    instance to change weights.
+
+    ``frozen`` makes the dataclass hashable; ``bad_keywords`` (a read-only
+    mapping, itself unhashable) is left out of the hash but still compared.
+    Copying/pickling goes through ``__reduce__``, which rebuilds the instance
+    from its constructor arguments.
+    """
 
     # Resolution bonuses
     resolution_2160p: int = 25
@@ -70,12 +85,22 @@ class ScoringWeights:
     size_too_large_gb: float = 80.0  # Above this might be problematic
     size_too_large_penalty: int = -10
 
-    # Bad keywords penalties
-    bad_keywords: Optional[dict[str, int]] = None
+    # Bad keywords penalties (read-only view once constructed)
+    bad_keywords: Optional[Mapping[str, int]] = field(default=None, hash=False)
+
+    # Derived in __post_init__ — not constructor arguments.
+    _bad_keyword_patterns: list[tuple[re.Pattern[str], int]] = field(
+        init=False, repr=False, compare=False
+    )
+    _english_audio_pattern: re.Pattern[str] = field(init=False, repr=False, compare=False)
+    _russian_subtitle_pattern: re.Pattern[str] = field(init=False, repr=False, compare=False)
+    _russian_dub_pattern: re.Pattern[str] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        if self.bad_keywords is None:
-            self.bad_keywords = {
+        # Frozen dataclass: derived attributes go through object.__setattr__.
+        bad_keywords = self.bad_keywords
+        if bad_keywords is None:
+            bad_keywords = {
                 "sample": -200,
                 "trailer": -200,
                 "teaser": -200,
@@ -94,6 +119,7 @@ class ScoringWeights:
                 "korean": -3,
                 "chinese": -3,
             }
+        object.__setattr__(self, "bad_keywords", MappingProxyType(dict(bad_keywords)))
 
         # Pre-compile bad-keyword regex patterns (PERF-05), IGNORECASE.
         #
@@ -111,23 +137,34 @@ class ScoringWeights:
             else:
                 pat = re.compile(rf"\b{esc}\b", re.IGNORECASE)
             patterns.append((pat, penalty))
-        self._bad_keyword_patterns = patterns
+        object.__setattr__(self, "_bad_keyword_patterns", patterns)
         # Language markers are release-title tokens, not codec information.
         # Keep ENG strict so normal words and titles do not produce false positives.
-        self._english_audio_pattern = re.compile(
+        object.__setattr__(self, "_english_audio_pattern", re.compile(
             r"(?<![A-Za-z0-9])(?:ENG|ENGLISH)(?![A-Za-z0-9])", re.IGNORECASE
-        )
-        self._russian_subtitle_pattern = re.compile(
+        ))
+        object.__setattr__(self, "_russian_subtitle_pattern", re.compile(
             r"(?<![A-Za-z0-9])(?:RUS\.?(?:SUB|SRT|FORCED)|SUBS?\.?RUS|"
             r"RUSSIAN\.?(?:SUB|SRT|FORCED))(?![A-Za-z0-9])",
             re.IGNORECASE,
-        )
-        self._russian_dub_pattern = re.compile(
+        ))
+        object.__setattr__(self, "_russian_dub_pattern", re.compile(
             r"(?<![A-Za-z0-9])(?:DUB\.?RUS|RUS\.?DUB|DVO|MVO|AVO|LOSTFILM|"
             r"DUB(?:BED)?\.?(?:RU|RUS|RUSSIAN)|(?:RU|RUS|RUSSIAN)\.?(?:DUB|AUDIO)|"
             r"SELEZEN|GLADIATOR|RG\.PARAVOZIK|HDREZKA|JASKIER)(?![A-Za-z0-9])",
             re.IGNORECASE,
+        ))
+
+    def __reduce__(self):
+        # The read-only mappingproxy can't be pickled (so neither copied nor
+        # deep-copied); rebuild from the constructor arguments instead, which
+        # also recompiles the derived patterns.
+        args = tuple(
+            dict(self.bad_keywords) if f.name == "bad_keywords" else getattr(self, f.name)
+            for f in fields(self)
+            if f.init
         )
+        return (type(self), args)
 
 
 class ScoringService:
@@ -156,6 +193,11 @@ class ScoringService:
         Returns:
             Calculated score (0-100 base, can go higher or negative)
         """
+        # Pure-Python on purpose: the bot runs on a Raspberry Pi from a slim
+        # image with no compiler toolchain, and this is a few dozen compares
+        # per release. Binding the weights to a local keeps each of those
+        # reads a LOAD_FAST instead of a self.weights attribute chain.
+        w = self.weights
         score = 50  # Base score
 
         # Legacy Prowlarr score, if a pre-migration session still carries one
@@ -168,107 +210,107 @@ class ScoringService:
         # Resolution scoring
         if quality.resolution:
             if quality.resolution == "2160p":
-                score += self.weights.resolution_2160p
+                score += w.resolution_2160p
             elif quality.resolution == "1080p":
-                score += self.weights.resolution_1080p
+                score += w.resolution_1080p
             elif quality.resolution == "720p":
-                score += self.weights.resolution_720p
+                score += w.resolution_720p
             elif quality.resolution == "480p":
-                score += self.weights.resolution_480p
+                score += w.resolution_480p
 
             # DEAD-06: user preference bonus — "Качество" setting was collected
             # but never fed into scoring; the pipeline now honours it.
             if preferred_resolution and quality.resolution == preferred_resolution:
-                score += self.weights.preferred_resolution_bonus
+                score += w.preferred_resolution_bonus
 
         # Source scoring — LOGIC-01: REMUX is independent of whether a source
         # token was parsed (a "Title.2160p.REMUX" with no BluRay/WEB token still
         # deserves the remux bonus), so check it before the source ladder.
         if quality.is_remux:
-            score += self.weights.source_remux
+            score += w.source_remux
         elif quality.source:
             source = quality.source.lower()
             if "bluray" in source:
-                score += self.weights.source_bluray
+                score += w.source_bluray
             elif "web-dl" in source or "webdl" in source:
-                score += self.weights.source_webdl
+                score += w.source_webdl
             elif "webrip" in source:
-                score += self.weights.source_webrip
+                score += w.source_webrip
             elif "hdtv" in source:
-                score += self.weights.source_hdtv
+                score += w.source_hdtv
             elif "dvdrip" in source:
-                score += self.weights.source_dvdrip
+                score += w.source_dvdrip
             elif "cam" in source:
-                score += self.weights.source_cam
+                score += w.source_cam
             elif source in ("ts", "telesync"):
-                score += self.weights.source_ts
+                score += w.source_ts
             elif source in ("tc", "telecine"):
-                score += self.weights.source_tc
+                score += w.source_tc
 
         # Codec scoring
         if quality.codec:
             codec = quality.codec.lower()
             if "x265" in codec or "hevc" in codec:
-                score += self.weights.codec_x265
+                score += w.codec_x265
             elif "av1" in codec:
-                score += self.weights.codec_av1
+                score += w.codec_av1
             elif "x264" in codec:
-                score += self.weights.codec_x264
+                score += w.codec_x264
 
         # HDR scoring (mutually exclusive)
         if quality.hdr:
             hdr = quality.hdr.lower()
             if "dv" in hdr or "dolby vision" in hdr:
-                score += self.weights.hdr_dolby_vision
+                score += w.hdr_dolby_vision
             elif "hdr10+" in hdr:
-                score += self.weights.hdr_hdr10plus
+                score += w.hdr_hdr10plus
             elif "hdr10" in hdr or "hdr" in hdr:
-                score += self.weights.hdr_hdr10
+                score += w.hdr_hdr10
 
         # Audio scoring
         if quality.audio:
             audio = quality.audio.lower()
             if "atmos" in audio:
-                score += self.weights.audio_atmos
+                score += w.audio_atmos
             elif "truehd" in audio:
-                score += self.weights.audio_truehd
+                score += w.audio_truehd
             elif "dts-hd" in audio or "dtshd" in audio:
-                score += self.weights.audio_dtshd
+                score += w.audio_dtshd
             elif "dts" in audio:
-                score += self.weights.audio_dts
+                score += w.audio_dts
             elif "dd5.1" in audio or "dd 5.1" in audio:
-                score += self.weights.audio_dd51
+                score += w.audio_dd51
 
         # Repack/Proper bonuses
         if quality.is_repack:
-            score += self.weights.repack_bonus
+            score += w.repack_bonus
         if quality.is_proper:
-            score += self.weights.proper_bonus
+            score += w.proper_bonus
 
         # Prefer the requested language combination. Russian
         # voice-over markers land in quality.subtitle, so classify the value instead
         # of treating every non-empty value as subtitles.
         title = result.title
         subtitle_marker = (quality.subtitle or "").lower()
-        has_english_audio = bool(self.weights._english_audio_pattern.search(title))
+        has_english_audio = bool(w._english_audio_pattern.search(title))
         has_russian_subtitles = subtitle_marker == "russub" or bool(
-            self.weights._russian_subtitle_pattern.search(title)
+            w._russian_subtitle_pattern.search(title)
         )
         has_russian_dub = subtitle_marker in {"dvo", "mvo", "avo"} or bool(
-            self.weights._russian_dub_pattern.search(title)
+            w._russian_dub_pattern.search(title)
         )
         if has_english_audio:
-            score += self.weights.english_audio_bonus
+            score += w.english_audio_bonus
         if has_russian_subtitles:
-            score += self.weights.russian_subtitle_bonus
+            score += w.russian_subtitle_bonus
         if has_russian_dub and not has_english_audio:
-            score += self.weights.russian_dub_without_english_penalty
+            score += w.russian_dub_without_english_penalty
 
         # Seeder bonus
         if result.seeders is not None and result.seeders > 0:
             seeder_bonus = min(
-                (result.seeders // 10) * self.weights.seeder_bonus_per_10,
-                self.weights.seeder_bonus_cap
+                (result.seeders // 10) * w.seeder_bonus_per_10,
+                w.seeder_bonus_cap
             )
             score += seeder_bonus
 
@@ -276,8 +318,8 @@ class ScoringService:
         size_gb = result.get_size_gb()
         if size_gb > 0:
             # Adjust thresholds based on content type
-            min_size = self.weights.size_too_small_gb
-            max_size = self.weights.size_too_large_gb
+            min_size = w.size_too_small_gb
+            max_size = w.size_too_large_gb
 
             if content_type == ContentType.SERIES:
                 # Series episodes are typically smaller
@@ -289,13 +331,13 @@ class ScoringService:
                     max_size = 10.0  # Single episode max
 
             if size_gb < min_size:
-                score += self.weights.size_too_small_penalty
+                score += w.size_too_small_penalty
             elif size_gb > max_size:
-                score += self.weights.size_too_large_penalty
+                score += w.size_too_large_penalty
 
         # Bad keywords penalties — use pre-compiled patterns (PERF-05)
         title = result.title
-        for pattern, penalty in self.weights._bad_keyword_patterns:
+        for pattern, penalty in w._bad_keyword_patterns:
             if pattern.search(title):
                 score += penalty
 
@@ -337,6 +379,8 @@ class ScoringService:
         for r in results:
             r.calculated_score = self.calculate_score(r, content_type, preferred_resolution)
 
+        # The key inverts/negates three fields, so it can't be an
+        # operator.attrgetter — the single-field sorts elsewhere use one.
         results.sort(
             key=lambda r: (
                 # False sorts before True, so invert: allowed (or unknown) first.
@@ -351,3 +395,8 @@ class ScoringService:
     # caller (only their own tests exercised them). The one thing they were
     # "on the way to" — preferred_resolution actually affecting ranking — is
     # now handled properly inside calculate_score/sort_results above.
+    #
+    # For the same reason there is no filter-then-score fast path: nothing
+    # downstream discards a scored candidate. Every release (0-seeder CAMs
+    # included) is listed with its score and may still be force-grabbed, so a
+    # cheap pre-filter would only hide results, not save work.
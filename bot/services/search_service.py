@@ -19,6 +19,7 @@ import asyncio
 import re
 import time
 from difflib import SequenceMatcher
+from operator import itemgetter
 from typing import Any, NamedTuple, Optional
 
 import structlog
@@ -30,16 +31,19 @@ from bot.services.scoring import ScoringService
 logger = structlog.get_logger()
 
 
-# Pre-compiled patterns (PERF-22): avoid re.compile per detect call.
-_SERIES_PATTERNS = [
-    re.compile(r"\bs\d{1,2}\b", re.IGNORECASE),          # S01, S1 (BUG-11: \b)
-    re.compile(r"\bs\d{1,2}e\d{1,3}\b", re.IGNORECASE),  # S01E01
-    re.compile(r"\bseason\s*\d+", re.IGNORECASE),
-    re.compile(r"\bseries\s*\d+", re.IGNORECASE),
-    re.compile(r"\b\d{1,2}x\d{1,3}\b"),                  # 1x01
-    re.compile(r"сезон", re.IGNORECASE),
-    re.compile(r"серия", re.IGNORECASE),
-]
+# Pre-compiled patterns (PERF-22): avoid re.compile per detect call. The
+# episodic markers are one alternation so a query is scanned once, not once
+# per marker.
+_SERIES_RE = re.compile(
+    r"\bs\d{1,2}\b"                  # S01, S1 (BUG-11: \b)
+    r"|\bs\d{1,2}e\d{1,3}\b"         # S01E01
+    r"|\bseason\s*\d+"
+    r"|\bseries\s*\d+"
+    r"|(?-i:\b\d{1,2}x\d{1,3}\b)"   # 1x01 — lowercase x only, as before
+    r"|сезон"
+    r"|серия",
+    re.IGNORECASE,
+)
 
 _YEAR_RE = re.compile(r"\b(19\d{2}|20\d{2}|21\d{2})\b")
 _SE_RE = re.compile(r"s(\d{1,2})(?:e(\d{1,3}))?", re.IGNORECASE)
@@ -175,7 +179,7 @@ class SearchService:
         # series-vs-anime, which are separate Scryer libraries with separate
         # quality profiles. So it narrows the candidate set instead of
         # short-circuiting the way it used to.
-        episodic = any(pattern.search(clean_query) for pattern in _SERIES_PATTERNS)
+        episodic = _SERIES_RE.search(clean_query) is not None
 
         cache_key = _normalize_query(query)
         cached = _cache_get(cache_key)
@@ -241,7 +245,7 @@ class SearchService:
                 music_score *= 0.7
         scored.append((ContentType.MUSIC, music_score, "music_match", []))
 
-        scored.sort(key=lambda x: x[1], reverse=True)
+        scored.sort(key=itemgetter(1), reverse=True)
         top_type, top_score, reason, winning_items = scored[0]
         runner_up_type, runner_up_score = scored[1][0], scored[1][1]
 
@@ -10,6 +10,8 @@ Admin-only commands (`/users`, `/adduser`, `/deluser`) are deliberately absent:
 advertising them to everyone only produces "недостаточно прав" replies.
 """
 
+from functools import lru_cache
+
 from aiogram.types import BotCommand
 
 #: (heading, [(command, description)]) — order is the order both surfaces show.
@@ -54,8 +56,13 @@ def bot_commands() -> list[BotCommand]:
     ]
 
 
+@lru_cache
 def render_help() -> str:
-    """The `/help` text, grouped the same way the catalog is."""
+    """The `/help` text, grouped the same way the catalog is.
+
+    Built once per process: the catalog is a module constant, so every
+    `/help` after the first is just the cached string.
+    """
     blocks = []
     for heading, entries in COMMAND_GROUPS:
         lines = [f"<b>{heading}:</b>"]
@@ -1,18 +1,34 @@
 """Shared helpers for message formatters — HTML escaping, timezone conversion,
-progress bars and safe truncation. Used by every domain formatter module.
+progress bars and (safe) truncation. Used by every domain formatter module.
 """
 
 import html
 from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
 from typing import Optional
 from zoneinfo import ZoneInfo
 
+from bot.config import get_settings
+
+
+def _e_str(text: str) -> str:
+    """`html.escape` for values already known to be `str` (required/str-typed
+    model fields): skips `_e`'s falsy check and `str()` cast.
+
+    Most titles contain none of the five characters `html.escape` rewrites,
+    so check for them first and hand the string back untouched — five
+    C-level `in` scans are ~3x cheaper than escape's five `replace` calls.
+    """
+    if "&" in text or "<" in text or ">" in text or '"' in text or "'" in text:
+        return html.escape(text)
+    return text
+
 
 def _e(text) -> str:
     """Escape HTML entities in user-provided text."""
     if not text:
         return ""
-    return html.escape(str(text))
+    return _e_str(str(text))
 
 
 # BUG-06/DEAD-14: module-level ZoneInfo cache — constructing ZoneInfo() parses
@@ -50,17 +66,60 @@ def _to_local(dt: Optional[datetime]) -> Optional[datetime]:
         return None
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
-    from bot.config import get_settings
-
     tz = _get_cached_zoneinfo(get_settings().timezone)
     return dt.astimezone(tz)
 
 
-def _progress_bar(progress: float, length: int = 20) -> str:
-    """Create a text-based progress bar."""
-    filled = int(length * progress)
-    empty = length - filled
-    return "█" * filled + "░" * empty
+def _fmt_dt_full(dt: datetime) -> str:
+    """`dt.strftime("%d.%m.%Y %H:%M")` without the strftime machinery."""
+    return f"{dt.day:02d}.{dt.month:02d}.{dt.year} {dt.hour:02d}:{dt.minute:02d}"
+
+
+def _fmt_dt_short(dt: datetime) -> str:
+    """`dt.strftime("%d.%m %H:%M")` without the strftime machinery."""
+    return f"{dt.day:02d}.{dt.month:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+
+#: The fixed formats the formatters actually use, rendered with plain
+#: f-strings; any other format still goes through strftime.
+_DT_FORMATTERS = {
+    "%d.%m.%Y %H:%M": _fmt_dt_full,
+    "%d.%m %H:%M": _fmt_dt_short,
+}
+
+
+def _format_local(dt: datetime, fmt: str) -> str:
+    """`_to_local(dt).strftime(fmt)`, memoised.
+
+    A history page or torrent list repeats the same minute many times over;
+    the cache key includes the configured timezone, so a TIMEZONE change
+    (tests reset settings) never serves a stale rendering.
+    """
+    return _format_local_cached(dt, fmt, get_settings().timezone)
+
+
+@lru_cache(maxsize=1024)
+def _format_local_cached(dt: datetime, fmt: str, tz_name: str) -> str:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    local = dt.astimezone(_get_cached_zoneinfo(tz_name))
+    render = _DT_FORMATTERS.get(fmt)
+    return render(local) if render is not None else local.strftime(fmt)
+
+
+#: Every bar `_progress_bar` can return at the default length — there are
+#: only 21 of them, so the common call is a tuple index, not two string
+#: multiplications and a concat.
+_BAR_LENGTH = 20
+_BARS = tuple("█" * i + "░" * (_BAR_LENGTH - i) for i in range(_BAR_LENGTH + 1))
+
+
+def _progress_bar(progress: float, length: int = _BAR_LENGTH) -> str:
+    """Create a text-based progress bar (progress clamped to 0.0–1.0)."""
+    filled = min(max(int(length * progress), 0), length)
+    if length == _BAR_LENGTH:
+        return _BARS[filled]
+    return "█" * filled + "░" * (length - filled)
 
 
 def _safe_truncate(text: str, max_len: int = 3800) -> str:
@@ -10,9 +10,35 @@ monkeypatches the `datetime` name on the `bot.ui.formatters` module object
 patch, since it would resolve `datetime` from this module's globals instead.
 """
 
-from datetime import datetime
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 
-from bot.ui.formatters._common import _to_local
+from bot.config import get_settings
+from bot.ui.formatters._common import _get_cached_zoneinfo
+
+
+#: Russian month names in the genitive ("5 мая"), indexed by month number.
+_MONTHS_GENITIVE = (
+    "", "января", "февраля", "марта", "апреля", "мая", "июня",
+    "июля", "августа", "сентября", "октября", "ноября", "декабря",
+)
+
+#: The calendar's `" [...]"` release-type suffix for every combination of
+#: (digital_release, physical_release, in_cinemas), indexed by the bit mask
+#: ``digital | physical << 1 | cinemas << 2``.
+_RELEASE_TYPE_SUFFIXES = tuple(
+    f" [{', '.join(label for bit, label in enumerate(('💾 цифровой', '📀 физический', '🎥 кино')) if mask >> bit & 1)}]"
+    if mask else ""
+    for mask in range(8)
+)
+
+
+def _is_iso_date(s: str) -> bool:
+    """Cheap shape check for a 10-char ``YYYY-MM-DD`` string."""
+    return s[4] == "-" and s[7] == "-" and s[:4].isdigit() and s[5:7].isdigit() and s[8:].isdigit()
 
 
 def _extract_date_key(date_str: str) -> str:
@@ -20,32 +46,62 @@ def _extract_date_key(date_str: str) -> str:
 
     BUG-11: parse as tz-aware and convert to the configured TIMEZONE
     so the *local* calendar day is used for grouping.
+
+    A bare ``YYYY-MM-DD`` (movie/album release dates) has no time of day to
+    convert, so it is its own key — returned straight away without building
+    a datetime. Shifting it as "midnight UTC" would move it to the previous
+    day in any timezone west of UTC.
     """
     if not date_str:
         return "9999-12-31"
+    if len(date_str) == 10 and _is_iso_date(date_str):
+        return date_str
+    return _local_date_key(date_str, get_settings().timezone)
+
+
+@lru_cache(maxsize=256)
+def _local_date_key(date_str: str, tz_name: str) -> str:
+    """Memoised body of `_extract_date_key` — a calendar repeats the same
+    air/release dates many times. Keyed by tz name so a TIMEZONE change
+    never reuses a key computed for the old zone."""
     try:
-        dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        local = _to_local(dt)
-        return local.strftime("%Y-%m-%d")
+        # fromisoformat takes a trailing "Z" natively since 3.11 (we need 3.12).
+        dt = datetime.fromisoformat(date_str)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        local = dt.astimezone(_get_cached_zoneinfo(tz_name))
+        return f"{local.year:04d}-{local.month:02d}-{local.day:02d}"
     except (ValueError, IndexError):
         return date_str[:10] if len(date_str) >= 10 else "9999-12-31"
 
 
+def _group_by_date(items: Iterable[dict], field: str) -> Iterator[tuple[str, list[dict]]]:
+    """Yield `(date_key, items)` in date order, grouping on `item[field]`.
+
+    One stable sort + `itertools.groupby` instead of a setdefault dict and a
+    sort of its keys; items keep their input order within a day.
+    """
+    keyed = sorted(((_extract_date_key(item.get(field, "")), item) for item in items), key=itemgetter(0))
+    for date_key, group in groupby(keyed, key=itemgetter(0)):
+        yield date_key, [item for _, item in group]
+
+
+@lru_cache(maxsize=512)
 def _format_date_header(date_key: str, today) -> str:
-    """Format date key to human-readable header with relative day marker."""
-    months = [
-        "", "января", "февраля", "марта", "апреля", "мая", "июня",
-        "июля", "августа", "сентября", "октября", "ноября", "декабря",
-    ]
+    """Format date key to human-readable header with relative day marker.
+
+    Pure in `(date_key, today)` — both hashable — so it is memoised: a
+    calendar shows the same few dates over and over, and `today` in the key
+    means yesterday's "сегодня" can't leak past midnight.
+    """
     try:
-        from datetime import date as date_cls
         parts = date_key.split("-")
-        dt_date = date_cls(int(parts[0]), int(parts[1]), int(parts[2]))
+        dt_date = date(int(parts[0]), int(parts[1]), int(parts[2]))
     except (ValueError, IndexError):
         return date_key
 
     diff = (dt_date - today).days
-    day_month = f"{dt_date.day} {months[dt_date.month]}"
+    day_month = f"{dt_date.day} {_MONTHS_GENITIVE[dt_date.month]}"
 
     if diff == 0:
         return f"{day_month} — сегодня"
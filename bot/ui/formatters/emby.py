@@ -3,11 +3,63 @@
 from typing import TYPE_CHECKING, Optional
 
 from bot.ui.formatters._common import _e
+from bot.ui.text import truncate
 
 if TYPE_CHECKING:
     from bot.clients.emby import EmbyServerInfo
 
 
+#: Overview caps: one-liner under each trending entry / poster caption body.
+_TRENDING_OVERVIEW_LIMIT = 103
+_POSTER_OVERVIEW_LIMIT = 500
+
+#: Rating sources in preference order — TMDb first, then the others.
+_RATING_SOURCES = ("tmdb", "imdb", "rottenTomatoes")
+
+
+def _get_rating(ratings: dict) -> Optional[float]:
+    """First available rating from `ratings` (already flattened to
+    `{source: number}` by the content models)."""
+    if not ratings:
+        return None
+    for source in _RATING_SOURCES:
+        value = ratings.get(source)
+        if value is not None:
+            return value
+    return None
+
+
+#: kind → (genitive plural for the heading, noun for the footer hint).
+_TRENDING_COPY = {
+    "movie": ("фильмов", "фильм"),
+    "series": ("сериалов", "сериал"),
+}
+
+
+def _format_trending(items: list, kind: str) -> str:
+    """Shared body of format_trending_movies/format_trending_series — the two
+    lists differ only in their copy (see _TRENDING_COPY)."""
+    plural, noun = _TRENDING_COPY[kind]
+    lines = [
+        f"🔥 <b>Топ популярных {plural}</b>\n",
+        "<i>По данным TMDb (The Movie Database)</i>\n",
+    ]
+
+    for i, item in enumerate(items[:10], 1):
+        rating_value = _get_rating(item.ratings)
+        year = f" ({item.year})" if item.year else ""
+
+        lines.append(f"{i}. <b>{_e(item.title)}</b>{year}")
+        if rating_value:
+            lines.append(f"   ⭐ {rating_value:.1f}")
+        if item.overview:
+            lines.append(f"   <i>{_e(truncate(item.overview, _TRENDING_OVERVIEW_LIMIT))}</i>")
+        lines.append("")
+
+    lines.append(f"\n💡 Нажмите на {noun} чтобы увидеть постер")
+    return "\n".join(lines)
+
+
 class _EmbyFormatters:
     """Emby server status and trending-content formatting mixin."""
 
@@ -59,83 +111,22 @@ class _EmbyFormatters:
 
         return "\n".join(lines)
 
-    @staticmethod
-    def _get_rating(ratings: dict) -> Optional[float]:
-        """Extract rating value from ratings dict."""
-        if not ratings:
-            return None
-        # Try TMDb first, then other sources
-        for source in ["tmdb", "imdb", "rottenTomatoes"]:
-            if source in ratings:
-                val = ratings[source]
-                if isinstance(val, dict) and "value" in val:
-                    return val["value"]
-                elif isinstance(val, (int, float)):
-                    return val
-        return None
+    _get_rating = staticmethod(_get_rating)
 
     @staticmethod
     def format_trending_movies(movies: list) -> str:
         """Format trending movies list."""
-        lines = [
-            "🔥 <b>Топ популярных фильмов</b>\n",
-            "<i>По данным TMDb (The Movie Database)</i>\n",
-        ]
-
-        for i, movie in enumerate(movies[:10], 1):
-            rating_value = _EmbyFormatters._get_rating(movie.ratings)
-            rating = f"⭐ {rating_value:.1f}" if rating_value else ""
-            year = f" ({movie.year})" if movie.year else ""
-            title = _e(movie.title)
-
-            lines.append(f"{i}. <b>{title}</b>{year}")
-            if rating:
-                lines.append(f"   {rating}")
-            if movie.overview:
-                overview = (
-                    movie.overview[:100] + "..."
-                    if len(movie.overview) > 100
-                    else movie.overview
-                )
-                lines.append(f"   <i>{_e(overview)}</i>")
-            lines.append("")
-
-        lines.append("\n💡 Нажмите на фильм чтобы увидеть постер")
-        return "\n".join(lines)
+        return _format_trending(movies, "movie")
 
     @staticmethod
     def format_trending_series(series_list: list) -> str:
         """Format trending series list."""
-        lines = [
-            "🔥 <b>Топ популярных сериалов</b>\n",
-            "<i>По данным TMDb (The Movie Database)</i>\n",
-        ]
-
-        for i, series in enumerate(series_list[:10], 1):
-            rating_value = _EmbyFormatters._get_rating(series.ratings)
-            rating = f"⭐ {rating_value:.1f}" if rating_value else ""
-            year = f" ({series.year})" if series.year else ""
-            title = _e(series.title)
-
-            lines.append(f"{i}. <b>{title}</b>{year}")
-            if rating:
-                lines.append(f"   {rating}")
-            if series.overview:
-                overview = (
-                    series.overview[:100] + "..."
-                    if len(series.overview) > 100
-                    else series.overview
-                )
-                lines.append(f"   <i>{_e(overview)}</i>")
-            lines.append("")
-
-        lines.append("\n💡 Нажмите на сериал чтобы увидеть постер")
-        return "\n".join(lines)
+        return _format_trending(series_list, "series")
 
     @staticmethod
     def format_movie_with_poster(movie) -> str:
         """Format movie details for display with poster."""
-        rating_value = _EmbyFormatters._get_rating(movie.ratings)
+        rating_value = _get_rating(movie.ratings)
         rating = f"⭐ {rating_value:.1f}/10" if rating_value else "Нет рейтинга"
         year = f" ({movie.year})" if movie.year else ""
         title = _e(movie.title)
@@ -146,10 +137,7 @@ class _EmbyFormatters:
         ]
 
         if movie.overview:
-            overview = movie.overview
-            if len(overview) > 500:
-                overview = overview[:497] + "..."
-            lines.append(f"\n{_e(overview)}")
+            lines.append(f"\n{_e(truncate(movie.overview, _POSTER_OVERVIEW_LIMIT))}")
 
         lines.append("\n💡 Нажмите кнопку ниже для добавления в библиотеку")
         return "\n".join(lines)
@@ -157,7 +145,7 @@ class _EmbyFormatters:
     @staticmethod
     def format_series_with_poster(series) -> str:
         """Format series details for display with poster."""
-        rating_value = _EmbyFormatters._get_rating(series.ratings)
+        rating_value = _get_rating(series.ratings)
         rating = f"⭐ {rating_value:.1f}/10" if rating_value else "Нет рейтинга"
         year = f" ({series.year})" if series.year else ""
         title = _e(series.title)
@@ -171,10 +159,7 @@ class _EmbyFormatters:
             lines.append(f"📡 {_e(series.network)}")
 
         if series.overview:
-            overview = series.overview
-            if len(overview) > 500:
-                overview = overview[:497] + "..."
-            lines.append(f"\n{_e(overview)}")
+            lines.append(f"\n{_e(truncate(series.overview, _POSTER_OVERVIEW_LIMIT))}")
 
         lines.append("\n💡 Нажмите кнопку ниже для добавления в библиотеку")
         return "\n".join(lines)
@@ -15,7 +15,8 @@ from bot.models import (
     SystemStatus,
     UserPreferences,
 )
-from bot.ui.formatters._common import _e, _safe_truncate, _to_local
+from bot.ui.formatters._common import _e, _e_str, _format_local, _safe_truncate
+from bot.ui.text import truncate
 
 #: Rule codes from Scryer's `scoringLog` that carry the language verdict.
 #: The language rule set ("English Audio + Russian Subtitles") only *penalises*
@@ -65,57 +66,118 @@ def _format_language_verdict(policy_codes: list[str]) -> str:
     )
 
 
-class _SearchFormatters:
-    """Search / content-info / status / preferences formatting mixin."""
+#: BUG-11: cap an individual release title before rendering — some indexers
+#: (notably RuTracker) return 300+ char titles; 5 of those on one page can
+#: blow past Telegram's 4096-char message cap and the search silently
+#: "fails" (MESSAGE_TOO_LONG).
+_MAX_RESULT_TITLE_LEN = 150
 
-    # BUG-11: cap an individual release title before rendering — some indexers
-    # (notably RuTracker) return 300+ char titles; 5 of those on one page can
-    # blow past Telegram's 4096-char message cap and the search silently
-    # "fails" (MESSAGE_TOO_LONG).
-    _MAX_RESULT_TITLE_LEN = 150
 
-    @staticmethod
-    def format_search_result(result: SearchResult, index: int) -> str:
-        """Format a single search result for display."""
-        title = result.title or ""
-        if len(title) > _SearchFormatters._MAX_RESULT_TITLE_LEN:
-            title = title[: _SearchFormatters._MAX_RESULT_TITLE_LEN - 1] + "…"
-        lines = [f"<b>{index}. {_e(title)}</b>"]
-
-        # Quality info
-        quality_parts = []
-        if result.quality.resolution:
-            quality_parts.append(result.quality.resolution)
-        if result.quality.source:
-            quality_parts.append(result.quality.source)
-        if result.quality.codec:
-            quality_parts.append(result.quality.codec)
-        if result.quality.hdr:
-            quality_parts.append(result.quality.hdr)
-        if result.quality.subtitle:
-            quality_parts.append(f"💬{result.quality.subtitle}")
-
-        if quality_parts:
-            lines.append(f"📊 Quality: {' / '.join(quality_parts)}")
-
-        # Size
-        if result.size > 0:
-            lines.append(f"💾 Size: {result.size_formatted}")
-
-        # Seeders/Leechers
-        if result.protocol == "torrent":
-            seeder_info = []
-            if result.seeders is not None:
-                seeder_info.append(f"S: {result.seeders}")
-            if result.leechers is not None:
-                seeder_info.append(f"L: {result.leechers}")
-            if seeder_info:
-                lines.append(f"🌱 {' | '.join(seeder_info)}")
+def format_search_result(result: SearchResult, index: int) -> str:
+    """Format a single search result for display.
 
-        # Indexer and score
-        lines.append(f"🔍 {_e(result.indexer)} | Score: {result.calculated_score}")
+    PERF: a plain module function — format_search_results_page calls it once
+    per result on every page flip, so it skips the class-attribute +
+    staticmethod descriptor lookup. `Formatters.format_search_result` still
+    resolves to this same function.
+    """
+    title = result.title or ""
+    if len(title) > _MAX_RESULT_TITLE_LEN:
+        title = title[: _MAX_RESULT_TITLE_LEN - 1] + "…"
+    q = result.quality
+    subtitle = q.subtitle
+    quality_parts = [
+        p for p in (q.resolution, q.source, q.codec, q.hdr, subtitle and f"💬{subtitle}") if p
+    ]
+
+    seeder_info = ""
+    if result.protocol == "torrent":
+        seeders = f"S: {result.seeders}" if result.seeders is not None else ""
+        leechers = f"L: {result.leechers}" if result.leechers is not None else ""
+        seeder_info = " | ".join(filter(None, (seeders, leechers)))
+
+    # Rendered once per result on every page flip — one f-string
+    # composed from conditional pieces instead of list.append + join.
+    return (
+        f"<b>{index}. {_e_str(title)}</b>\n"
+        + (f"📊 Quality: {' / '.join(quality_parts)}\n" if quality_parts else "")
+        + (f"💾 Size: {result.size_formatted}\n" if result.size > 0 else "")
+        + (f"🌱 {seeder_info}\n" if seeder_info else "")
+        + f"🔍 {_e_str(result.indexer)} | Score: {result.calculated_score}"
+    )
+
+
+#: Cap for movie/series/artist overviews on the content card.
+_OVERVIEW_LIMIT = 303
 
-        return "\n".join(lines)
+
+#: Quality block of the release card, in display order: (QualityInfo field,
+#: line template). Flags (is_remux/is_repack) simply ignore the `{}` value.
+_QUALITY_DETAIL_LINES = (
+    ("resolution", "  • Разрешение: {}"),
+    ("source", "  • Источник: {}"),
+    ("codec", "  • Кодек: {}"),
+    ("hdr", "  • HDR: {}"),
+    ("audio", "  • Аудио: {}"),
+    ("is_remux", "  • 📀 REMUX"),
+    ("is_repack", "  • 🔄 REPACK"),
+    ("subtitle", "  • 💬 Субтитры: {}"),
+)
+
+
+def _find_by_id(items: list, item_id: int | str | None):
+    """First item whose id matches `item_id`, or None (also when unset).
+
+    Compared as strings: profiles/folders carry int or str ids, and stored
+    preferences may still be numeric (see UserPreferences). One early-exit
+    scan — each list is looked up exactly once per render.
+    """
+    if item_id is None:
+        return None
+    key = str(item_id)
+    return next((item for item in items if str(item.id) == key), None)
+
+
+#: Catalog-status labels shared by the movie and series cards (only the
+#: "on disk" wording differs between the two, so that one stays inline).
+_STATUS_MONITORED = "👀 В библиотеке, отслеживается"
+_STATUS_IN_CATALOG = "📇 Есть в каталоге Scryer"
+
+#: Content-type emoji for the action-history list.
+_TYPE_EMOJI = {
+    ContentType.MOVIE: "🎬",
+    ContentType.SERIES: "📺",
+    ContentType.MUSIC: "🎵",  # LOGIC-22: music actions used to show the series emoji
+}
+
+#: Search-page header up to the query, emoji baked in per content type.
+#: Anything other than a movie keeps the series emoji, as it always has.
+_RESULTS_HEADER_PREFIX = {
+    ContentType.MOVIE: "🎬 <b>Результаты поиска:</b> <code>",
+    ContentType.SERIES: "📺 <b>Результаты поиска:</b> <code>",
+}
+
+
+def _format_action_row(action: ActionLog) -> str:
+    """One history entry of `format_action_log` — one line, or two when a
+    failed action carries an error message."""
+    emoji = "✅" if action.success else "❌"
+    type_emoji = _TYPE_EMOJI.get(action.content_type, "📺")
+    action_str = action.action_type.value.upper()
+    title = truncate(action.content_title or action.query or "Неизвестно", 30)
+    # Only the minute is shown, so drop seconds before the memoised render:
+    # a bulk operation's rows then share one cache entry.
+    date_str = _format_local(action.created_at.replace(second=0, microsecond=0), "%d.%m %H:%M")
+    row = f"{emoji} {type_emoji} {action_str}: {_e(title)} ({date_str})"
+    if not action.success and action.error_message:
+        row += f"\n   ↳ Ошибка: {_e(action.error_message[:50])}"
+    return row
+
+
+class _SearchFormatters:
+    """Search / content-info / status / preferences formatting mixin."""
+
+    format_search_result = staticmethod(format_search_result)
 
     @staticmethod
     def format_search_results_page(
@@ -127,17 +189,14 @@ class _SearchFormatters:
         per_page: int = 5,
     ) -> str:
         """Format a page of search results."""
-        type_emoji = "🎬" if content_type == ContentType.MOVIE else "📺"
-        header = f"{type_emoji} <b>Результаты поиска:</b> <code>{_e(query)}</code>\n"
+        header_prefix = _RESULTS_HEADER_PREFIX.get(content_type, _RESULTS_HEADER_PREFIX[ContentType.SERIES])
+        header = f"{header_prefix}{_e(query)}</code>\n"
         header += f"Стр. {page + 1}/{total_pages} | Показано: {len(results)}\n\n"
 
-        result_texts = []
-        for i, result in enumerate(results):
-            result_texts.append(
-                _SearchFormatters.format_search_result(result, i + 1 + (page * per_page))
-            )
-
-        page_text = header + "\n\n".join(result_texts)
+        fmt = format_search_result
+        page_text = header + "\n\n".join(
+            [fmt(result, index) for index, result in enumerate(results, page * per_page + 1)]
+        )
         # BUG-11/TEST-07: hard safety net on top of per-title truncation —
         # keeps the page well under Telegram's 4096-char message limit.
         return _safe_truncate(page_text, max_len=3800)
@@ -145,32 +204,21 @@ class _SearchFormatters:
     @staticmethod
     def format_release_details(result: SearchResult) -> str:
         """Format detailed view of a release."""
-        lines = [f"<b>{_e(result.title)}</b>\n"]
-
-        # Quality
-        lines.append("<b>📊 Качество:</b>")
-        if result.quality.resolution:
-            lines.append(f"  • Разрешение: {result.quality.resolution}")
-        if result.quality.source:
-            lines.append(f"  • Источник: {result.quality.source}")
-        if result.quality.codec:
-            lines.append(f"  • Кодек: {result.quality.codec}")
-        if result.quality.hdr:
-            lines.append(f"  • HDR: {result.quality.hdr}")
-        if result.quality.audio:
-            lines.append(f"  • Аудио: {result.quality.audio}")
-        if result.quality.is_remux:
-            lines.append("  • 📀 REMUX")
-        if result.quality.is_repack:
-            lines.append("  • 🔄 REPACK")
-        if result.quality.subtitle:
-            lines.append(f"  • 💬 Субтитры: {result.quality.subtitle}")
-
-        lines.append("")
+        # Fixed blocks go in as one multi-line entry each (cf. the torrent
+        # formatters) — fewer list slots than one append per line.
+        lines = [f"<b>{_e_str(result.title)}</b>\n\n<b>📊 Качество:</b>"]
+        quality = result.quality
+        lines.extend(
+            template.format(value)
+            for attr, template in _QUALITY_DETAIL_LINES
+            if (value := getattr(quality, attr))
+        )
 
         # Size and protocol
-        lines.append(f"💾 <b>Размер:</b> {result.size_formatted}")
-        lines.append(f"📡 <b>Протокол:</b> {result.protocol.upper()}")
+        lines.append(
+            f"\n💾 <b>Размер:</b> {result.size_formatted}\n"
+            f"📡 <b>Протокол:</b> {result.protocol.upper()}"
+        )
 
         # Torrent info
         if result.protocol == "torrent":
@@ -179,11 +227,11 @@ class _SearchFormatters:
             if result.leechers is not None:
                 lines.append(f"📥 <b>Личи:</b> {result.leechers}")
 
-        # Indexer
-        lines.append(f"🔍 <b>Индексатор:</b> {_e(result.indexer)}")
-
-        # Score
-        lines.append(f"\n<b>Оценка:</b> {result.calculated_score}/100")
+        # Indexer and score
+        lines.append(
+            f"🔍 <b>Индексатор:</b> {_e_str(result.indexer)}\n"
+            f"\n<b>Оценка:</b> {result.calculated_score}/100"
+        )
 
         # Season/episode info
         if result.detected_season is not None:
@@ -196,7 +244,7 @@ class _SearchFormatters:
 
         # Publish date (BUG-06: shown in the configured local timezone)
         if result.publish_date:
-            date_str = _to_local(result.publish_date).strftime("%d.%m.%Y %H:%M")
+            date_str = _format_local(result.publish_date, "%d.%m.%Y %H:%M")
             lines.append(f"📆 <b>Опубликовано:</b> {date_str}")
 
         language_note = _format_language_verdict(result.policy_codes)
@@ -227,10 +275,7 @@ class _SearchFormatters:
             lines.append(f"🏢 Студия: {_e(movie.studio)}")
 
         if movie.overview:
-            overview = movie.overview[:300]
-            if len(movie.overview) > 300:
-                overview += "..."
-            lines.append(f"\n📝 {_e(overview)}")
+            lines.append(f"\n📝 {_e(truncate(movie.overview, _OVERVIEW_LIMIT))}")
 
         # Status in the Scryer catalog. `scryer_id` alone only means "known to
         # Scryer" — a title is added unmonitored just to list its releases — so
@@ -239,9 +284,9 @@ class _SearchFormatters:
             if movie.has_file:
                 status = "✅ В библиотеке (скачан)"
             elif movie.monitored:
-                status = "👀 В библиотеке, отслеживается"
+                status = _STATUS_MONITORED
             else:
-                status = "📇 Есть в каталоге Scryer"
+                status = _STATUS_IN_CATALOG
             if movie.current_quality_tier:
                 status += f" · {_e(movie.current_quality_tier)}"
             lines.append(f"\n{status}")
@@ -267,11 +312,10 @@ class _SearchFormatters:
             lines.append(f"📡 Канал: {_e(series.network)}")
 
         if series.status:
-            status_emoji = "🟢" if series.status.lower() == "continuing" else "🔴"
-            status_text = (
-                "Выходит" if series.status.lower() == "continuing" else "Завершён"
-            )
-            lines.append(f"{status_emoji} Статус: {status_text}")
+            if series.status.lower() == "continuing":
+                lines.append("🟢 Статус: Выходит")
+            else:
+                lines.append("🔴 Статус: Завершён")
 
         lines.append(
             f"📊 Сезонов: {series.season_count} | Серий: {series.total_episode_count}"
@@ -284,10 +328,7 @@ class _SearchFormatters:
             lines.append(f"🎭 Жанры: {_e(', '.join(series.genres[:5]))}")
 
         if series.overview:
-            overview = series.overview[:300]
-            if len(series.overview) > 300:
-                overview += "..."
-            lines.append(f"\n📝 {_e(overview)}")
+            lines.append(f"\n📝 {_e(truncate(series.overview, _OVERVIEW_LIMIT))}")
 
         # Status in the Scryer catalog (see format_movie_info for the labels).
         if series.scryer_id:
@@ -298,9 +339,9 @@ class _SearchFormatters:
             if series.has_file:
                 status = "✅ В библиотеке"
             elif series.monitored:
-                status = "👀 В библиотеке, отслеживается"
+                status = _STATUS_MONITORED
             else:
-                status = "📇 Есть в каталоге Scryer"
+                status = _STATUS_IN_CATALOG
             lines.append(f"\n{status}")
 
         return "\n".join(lines)
@@ -349,10 +390,7 @@ class _SearchFormatters:
         if artist.album_count:
             lines.append(f"💿 Альбомов: {artist.album_count} | Треков: {artist.track_count}")
         if artist.overview:
-            overview = artist.overview[:300]
-            if len(artist.overview) > 300:
-                overview += "..."
-            lines.append(f"\n📝 {_e(overview)}")
+            lines.append(f"\n📝 {_e(truncate(artist.overview, _OVERVIEW_LIMIT))}")
 
         if artist.lidarr_id:
             lines.append("\n✅ В библиотеке")
@@ -411,16 +449,12 @@ class _SearchFormatters:
         lines = ["<b>⚙️ Ваши настройки</b>\n"]
 
         lines.append("<b>🗂 Scryer (кино / сериалы / аниме):</b>")
-        profile = next(
-            (p for p in profiles if str(p.id) == str(prefs.scryer_quality_profile_id)),
-            None,
-        )
+        # Unset overrides (the recommended setup) skip the scan entirely.
+        profile = _find_by_id(profiles, prefs.scryer_quality_profile_id)
         lines.append(
             f"  Профиль: {_e(profile.name) if profile else 'По умолчанию (профиль библиотеки)'}"
         )
-        folder = next(
-            (f for f in folders if str(f.id) == str(prefs.scryer_root_folder_id)), None
-        )
+        folder = _find_by_id(folders, prefs.scryer_root_folder_id)
         lines.append(
             f"  Папка: {_e(folder.path) if folder else 'По умолчанию (папка библиотеки)'}"
         )
@@ -440,35 +474,9 @@ class _SearchFormatters:
         if not actions:
             return "📭 История пуста."
 
-        lines = ["<b>📋 Последние действия</b>\n"]
-
-        _TYPE_EMOJI = {
-            ContentType.MOVIE: "🎬",
-            ContentType.SERIES: "📺",
-            ContentType.MUSIC: "🎵",  # LOGIC-22: music actions used to show the series emoji
-        }
-
-        for action in actions[:limit]:
-            emoji = "✅" if action.success else "❌"
-            type_emoji = _TYPE_EMOJI.get(action.content_type, "📺")
-
-            action_str = action.action_type.value.upper()
-            title = action.content_title or action.query or "Неизвестно"
-
-            if len(title) > 30:
-                title = title[:27] + "..."
-
-            date_str = _to_local(action.created_at).strftime("%d.%m %H:%M")
-
-            lines.append(
-                f"{emoji} {type_emoji} {action_str}: {_e(title)} ({date_str})"
-            )
-
-            if not action.success and action.error_message:
-                error = action.error_message[:50]
-                lines.append(f"   ↳ Ошибка: {_e(error)}")
-
-        return "\n".join(lines)
+        return "<b>📋 Последние действия</b>\n\n" + "\n".join(
+            [_format_action_row(action) for action in actions[:limit]]
+        )
 
     @staticmethod
     def format_error(error: str, include_retry: bool = True) -> str:
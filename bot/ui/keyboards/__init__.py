@@ -9,6 +9,12 @@ do ``from bot.ui.keyboards import Keyboards, CallbackData`` exactly as before.
 
 See ``bot/ui/formatters/__init__.py`` for the sibling package this split
 mirrors.
+
+Builders whose output depends only on a few hashable flags (or nothing) are
+``lru_cache``'d and hand every caller the same markup instance. aiogram only
+serialises a markup when sending it, and no handler edits one after the fact
+— keep it that way: a mutated cached keyboard would leak into every later
+message.
 """
 
 from bot.ui.keyboards._constants import CallbackData
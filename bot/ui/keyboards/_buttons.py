@@ -0,0 +1,64 @@
+"""Shared button instances for the keyboard builders.
+
+Cancel/back buttons are identical in every keyboard that carries them, so
+each is built once here and reused by reference (see the package
+``__init__.py`` docstring: markups — and so these buttons — are never
+mutated after construction).
+"""
+
+from collections.abc import Callable
+from functools import lru_cache
+
+from aiogram.types import InlineKeyboardButton
+
+from bot.ui.keyboards._constants import CallbackData
+
+_CANCEL_BTN = InlineKeyboardButton(text="❌ Отмена", callback_data=CallbackData.CANCEL)
+_SETTINGS_BACK_BTN = InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.SETTINGS)
+_TRENDING_BACK_BTN = InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.TRENDING_BACK)
+_TORRENT_BACK_BTN = InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.TORRENT_BACK)
+_TS_BACK_BTN = InlineKeyboardButton(text="⬅️ В меню", callback_data=CallbackData.TS_BACK)
+_TRENDING_MOVIES_BACK_BTN = InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.TRENDING_MOVIES)
+_TRENDING_SERIES_BACK_BTN = InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.TRENDING_SERIES)
+# LOGIC-24: dedicated music-back so search.handle_back doesn't reply
+# "сессия истекла" on a music session (which has no .results).
+_MUSIC_BACK_BTN = InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.MUSIC_BACK)
+
+
+@lru_cache(maxsize=256)
+def _page_counter_btn(page: int, total_pages: int) -> InlineKeyboardButton:
+    """The inert "N/M" button in a pagination row (`page` is 0-indexed).
+
+    Paging keeps showing the same few (page, total) pairs, so each button is
+    built once and shared like the fixed buttons above.
+    """
+    return InlineKeyboardButton(text=f"{page + 1}/{total_pages}", callback_data="noop")
+
+
+@lru_cache(maxsize=256)
+def _page_arrow_btn(text: str, callback_data: str) -> InlineKeyboardButton:
+    """A prev/next pagination button, memoised on its (glyph, target) pair
+    for the same reason as ``_page_counter_btn``."""
+    return InlineKeyboardButton(text=text, callback_data=callback_data)
+
+
+def _nav_row(
+    page: int,
+    total_pages: int,
+    page_callback: Callable[[int], str],
+    prev_text: str = "◀️",
+    next_text: str = "▶️",
+) -> list[InlineKeyboardButton]:
+    """A pagination row: [prev] N/M [next], arrows only where a page exists.
+
+    ``page_callback`` packs the callback data for a target page — each list
+    has its own callback family, the row shape is shared. Whether to show
+    the row at all for a single page is left to the caller.
+    """
+    row = []
+    if page > 0:
+        row.append(_page_arrow_btn(prev_text, page_callback(page - 1)))
+    row.append(_page_counter_btn(page, total_pages))
+    if page < total_pages - 1:
+        row.append(_page_arrow_btn(next_text, page_callback(page + 1)))
+    return row
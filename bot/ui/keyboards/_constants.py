@@ -65,6 +65,7 @@ class CallbackData:
     TORRENT_DELETE_FILES_CONFIRM = "t_delfc:"  # t_delfc:hash — confirmed, actually deletes
     TORRENT_REFRESH = "t_refresh"  # Refresh torrent list
     TORRENT_FILTER = "t_filter:"  # t_filter:downloading
+    TORRENT_FILTER_MENU = "t_filter:menu"  # Open the filter picker
     TORRENT_PAGE = "t_page:"  # t_page:2
     TORRENT_BACK = "t_back"  # Back to torrent list
     TORRENT_PAUSE_ALL = "t_pause_all"
@@ -1,5 +1,7 @@
 """Calendar-domain keyboard: period selector (7/14/30 days) + refresh."""
 
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from bot.ui.callbacks import CalCB
@@ -10,6 +12,7 @@ class _CalendarKeyboards:
     """Calendar keyboard mixin."""
 
     @staticmethod
+    @lru_cache
     def calendar_controls(current_days: int = 7) -> InlineKeyboardMarkup:
         """Create keyboard for calendar period selection."""
         periods = [
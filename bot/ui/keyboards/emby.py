@@ -1,5 +1,7 @@
 """Emby-domain keyboards: main control panel, restart/update confirmations."""
 
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from bot.ui.keyboards._constants import CallbackData
@@ -9,6 +11,7 @@ class _EmbyKeyboards:
     """Emby keyboard mixin."""
 
     @staticmethod
+    @lru_cache
     def emby_main(
         has_update: bool = False,
         can_restart: bool = True,
@@ -49,6 +52,7 @@ class _EmbyKeyboards:
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
     @staticmethod
+    @lru_cache
     def emby_confirm_restart() -> InlineKeyboardMarkup:
         """Create confirmation keyboard for server restart."""
         return InlineKeyboardMarkup(
@@ -66,6 +70,7 @@ class _EmbyKeyboards:
         )
 
     @staticmethod
+    @lru_cache
     def emby_confirm_update() -> InlineKeyboardMarkup:
         """Create confirmation keyboard for server update."""
         return InlineKeyboardMarkup(
@@ -1,5 +1,7 @@
 """Main reply-keyboard (persistent bottom menu) builder."""
 
+from functools import lru_cache
+
 from aiogram.types import KeyboardButton, ReplyKeyboardMarkup
 
 from bot.ui.menu import (
@@ -21,6 +23,7 @@ class _MenuKeyboards:
     """Main (reply) menu keyboard mixin."""
 
     @staticmethod
+    @lru_cache
     def main_menu() -> ReplyKeyboardMarkup:
         """Create main (reply) menu keyboard with the most used commands."""
         return ReplyKeyboardMarkup(
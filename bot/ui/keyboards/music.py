@@ -3,8 +3,10 @@
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from bot.models import ArtistInfo
-from bot.ui.callbacks import ArtistCB
+from bot.ui.callbacks import ArtistCB, SlskdCB
+from bot.ui.keyboards._buttons import _CANCEL_BTN, _MUSIC_BACK_BTN, _nav_row
 from bot.ui.keyboards._constants import CallbackData
+from bot.ui.text import truncate
 
 
 class _MusicKeyboards:
@@ -26,8 +28,7 @@ class _MusicKeyboards:
             idx = start_idx + i
             disamb = f" [{a.disambiguation}]" if a.disambiguation else ""
             label = f"{a.name}{disamb}"
-            if len(label) > 40:
-                label = label[:37] + "..."
+            label = truncate(label, 40)
             keyboard.append([
                 InlineKeyboardButton(
                     text=label,
@@ -36,23 +37,9 @@ class _MusicKeyboards:
             ])
 
         if total_pages > 1:
-            nav_buttons = []
-            if current_page > 0:
-                nav_buttons.append(
-                    InlineKeyboardButton(text="◀️", callback_data=f"{CallbackData.ARTIST_PAGE}{current_page - 1}")
-                )
-            nav_buttons.append(
-                InlineKeyboardButton(text=f"{current_page + 1}/{total_pages}", callback_data="noop")
-            )
-            if current_page < total_pages - 1:
-                nav_buttons.append(
-                    InlineKeyboardButton(text="▶️", callback_data=f"{CallbackData.ARTIST_PAGE}{current_page + 1}")
-                )
-            keyboard.append(nav_buttons)
+            keyboard.append(_nav_row(current_page, total_pages, lambda page: f"{CallbackData.ARTIST_PAGE}{page}"))
 
-        keyboard.append([
-            InlineKeyboardButton(text="❌ Отмена", callback_data=CallbackData.CANCEL),
-        ])
+        keyboard.append([_CANCEL_BTN])
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
     @staticmethod
@@ -67,30 +54,20 @@ class _MusicKeyboards:
             keyboard.append([
                 InlineKeyboardButton(text="➕ Добавить и искать", callback_data=CallbackData.CONFIRM_GRAB),
             ])
-        keyboard.append([
-            # LOGIC-24: dedicated music-back so search.handle_back doesn't reply
-            # "сессия истекла" on a music session (which has no .results).
-            InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.MUSIC_BACK),
-            InlineKeyboardButton(text="❌ Отмена", callback_data=CallbackData.CANCEL),
-        ])
+        keyboard.append([_MUSIC_BACK_BTN, _CANCEL_BTN])
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
     @staticmethod
     def slskd_results(results: list, per_page: int = 5) -> InlineKeyboardMarkup:
         """Keyboard for picking one Soulseek candidate (see `SlskdCB`)."""
-        from bot.ui.callbacks import SlskdCB
-
         keyboard = []
         for idx, result in enumerate(results[:per_page]):
             fmt = result.dominant_format.upper() or "?"
             label = f"{idx + 1}. {fmt} · {result.track_count} трек. · {result.size_formatted}"
-            if len(label) > 60:
-                label = label[:57] + "..."
+            label = truncate(label, 60)
             keyboard.append([
                 InlineKeyboardButton(text=label, callback_data=SlskdCB(idx=idx).pack())
             ])
 
-        keyboard.append([
-            InlineKeyboardButton(text="❌ Отмена", callback_data=CallbackData.CANCEL),
-        ])
+        keyboard.append([_CANCEL_BTN])
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
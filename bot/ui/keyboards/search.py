@@ -9,17 +9,61 @@ release/content-details concept, and reached from the composed ``Keyboards``
 class via normal attribute lookup either way.
 """
 
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from bot.models import ContentType, SearchResult, SeriesInfo
-from bot.ui.callbacks import PageCB, ReleaseCB, SeasonPresetCB
+from bot.ui.callbacks import PageCB, ReleaseCB, SeasonPresetCB, SeasonScopeCB, TitleActionCB, TitleCB
+from bot.ui.keyboards._buttons import _CANCEL_BTN, _nav_row
 from bot.ui.keyboards._constants import CallbackData
+from bot.ui.text import truncate
+
+
+@lru_cache(maxsize=256)
+def _release_callback(idx: int) -> str:
+    """`ReleaseCB(idx=idx).pack()`, memoised. Packing builds and validates a
+    pydantic model (~3 µs, ~30x a plain string) and every page flip re-packs
+    the same handful of indices."""
+    return ReleaseCB(idx=idx).pack()
+
+
+def _result_label(idx: int, result: SearchResult) -> str:
+    """Button label for one search result: number, resolution, seeders, size."""
+    quality = result.quality.resolution or "?"
+    seeders = f"S:{result.seeders}" if result.seeders else ""
+    size = result.size_formatted[:6] if result.size > 0 else ""
+
+    # One filtered join: a missing seeder count or size no longer
+    # leaves a double space in the label.
+    label = " ".join(p for p in (f"{idx + 1}.", quality, seeders, size) if p)
+    return truncate(label, 40)
+
+
+@lru_cache(maxsize=8)
+def _release_action_rows(can_grab: bool, show_force_grab: bool, is_series: bool) -> tuple[list, ...]:
+    """The fixed action rows under a release (everything but the link row).
+
+    Only eight flag combinations exist, so each set of rows is built once and
+    shared by every ``release_details`` markup with those flags.
+    """
+    rows = []
+    if can_grab:
+        rows.append([InlineKeyboardButton(text="✅ Скачать", callback_data=CallbackData.CONFIRM_GRAB)])
+    if show_force_grab:
+        rows.append([InlineKeyboardButton(text="⚡ Принудительно (qBit)", callback_data=CallbackData.FORCE_GRAB)])
+    # #2: let the user choose which seasons are monitored (series only).
+    if is_series:
+        rows.append([InlineKeyboardButton(text="📺 Мониторинг сезонов", callback_data=CallbackData.SEASON_MENU)])
+    rows.append([InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.BACK), _CANCEL_BTN])
+    return tuple(rows)
 
 
 class _SearchKeyboards:
     """Search-result / release-details keyboard mixin."""
 
     @staticmethod
+    @lru_cache
     def content_type_selection(show_music: bool = False) -> InlineKeyboardMarkup:
         """Create keyboard for selecting content type (movie/series/anime/music)."""
         first_row = [
@@ -31,7 +75,7 @@ class _SearchKeyboards:
         ]]
         if show_music:
             rows.append([InlineKeyboardButton(text="🎵 Музыка", callback_data=CallbackData.TYPE_MUSIC)])
-        rows.append([InlineKeyboardButton(text="❌ Отмена", callback_data=CallbackData.CANCEL)])
+        rows.append([_CANCEL_BTN])
         return InlineKeyboardMarkup(inline_keyboard=rows)
 
     @staticmethod
@@ -54,27 +98,11 @@ class _SearchKeyboards:
             show_grab_best: Whether to show "Grab Best" button
             best_score: Score of the best result
         """
-        keyboard = []
-
-        # Result buttons (numbered)
-        start_idx = current_page * per_page
-        for i, result in enumerate(results):
-            idx = start_idx + i
-            # Show basic info in button
-            quality = result.quality.resolution or "?"
-            seeders = f"S:{result.seeders}" if result.seeders else ""
-            size = result.size_formatted[:6] if result.size > 0 else ""
-
-            label = f"{idx + 1}. {quality} {seeders} {size}".strip()
-            if len(label) > 40:
-                label = label[:37] + "..."
-
-            keyboard.append([
-                InlineKeyboardButton(
-                    text=label,
-                    callback_data=ReleaseCB(idx=idx).pack(),
-                )
-            ])
+        # Result buttons (numbered), one row each
+        keyboard = [
+            [InlineKeyboardButton(text=_result_label(idx, result), callback_data=_release_callback(idx))]
+            for idx, result in enumerate(results, current_page * per_page)
+        ]
 
         # Grab best button
         if show_grab_best and results:
@@ -86,28 +114,12 @@ class _SearchKeyboards:
             ])
 
         # Pagination row — #1: typed PageCB(scope="search") instead of "page:" string
-        nav_buttons = []
-        if current_page > 0:
-            nav_buttons.append(
-                InlineKeyboardButton(text="◀️", callback_data=PageCB(scope="search", page=current_page - 1).pack())
-            )
-
-        nav_buttons.append(
-            InlineKeyboardButton(text=f"{current_page + 1}/{total_pages}", callback_data="noop")
+        keyboard.append(
+            _nav_row(current_page, total_pages, lambda page: PageCB(scope="search", page=page).pack())
         )
 
-        if current_page < total_pages - 1:
-            nav_buttons.append(
-                InlineKeyboardButton(text="▶️", callback_data=PageCB(scope="search", page=current_page + 1).pack())
-            )
-
-        if nav_buttons:
-            keyboard.append(nav_buttons)
-
         # Cancel button
-        keyboard.append([
-            InlineKeyboardButton(text="❌ Отмена", callback_data=CallbackData.CANCEL),
-        ])
+        keyboard.append([_CANCEL_BTN])
 
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
@@ -131,30 +143,13 @@ class _SearchKeyboards:
             if links:
                 keyboard.append(links)
 
-        if can_grab:
-            keyboard.append([
-                InlineKeyboardButton(text="✅ Скачать", callback_data=CallbackData.CONFIRM_GRAB),
-            ])
-
-        if show_force_grab:
-            keyboard.append([
-                InlineKeyboardButton(text="⚡ Принудительно (qBit)", callback_data=CallbackData.FORCE_GRAB),
-            ])
-
-        # #2: let the user choose which seasons are monitored (series only).
-        if content_type == ContentType.SERIES:
-            keyboard.append([
-                InlineKeyboardButton(text="📺 Мониторинг сезонов", callback_data=CallbackData.SEASON_MENU),
-            ])
-
-        keyboard.append([
-            InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.BACK),
-            InlineKeyboardButton(text="❌ Отмена", callback_data=CallbackData.CANCEL),
-        ])
+        # The link row depends on `content`; the rest only on three flags.
+        keyboard.extend(_release_action_rows(can_grab, show_force_grab, content_type == ContentType.SERIES))
 
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
     @staticmethod
+    @lru_cache
     def season_presets() -> InlineKeyboardMarkup:
         """Feature #2: season-monitoring preset picker.
 
@@ -195,21 +190,16 @@ class _SearchKeyboards:
     @staticmethod
     def title_candidates(candidates: list) -> InlineKeyboardMarkup:
         """Ask which title the user meant (see `needs_title_confirmation`)."""
-        from bot.ui.callbacks import TitleCB
-
         keyboard = []
         for idx, candidate in enumerate(candidates[:5]):
             year = f" ({candidate.year})" if getattr(candidate, "year", None) else ""
             label = f"{idx + 1}. {candidate.title}{year}"
-            if len(label) > 60:
-                label = label[:57] + "..."
+            label = truncate(label, 60)
             keyboard.append([
                 InlineKeyboardButton(text=label, callback_data=TitleCB(idx=idx).pack())
             ])
 
-        keyboard.append([
-            InlineKeyboardButton(text="❌ Отмена", callback_data=CallbackData.CANCEL),
-        ])
+        keyboard.append([_CANCEL_BTN])
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
     @staticmethod
@@ -219,8 +209,6 @@ class _SearchKeyboards:
         The monitoring button is a toggle: it shows the action, not the state,
         so the user never has to work out what pressing it will do.
         """
-        from bot.ui.callbacks import TitleActionCB
-
         title_id = getattr(title, "scryer_id", "") or ""
         monitored = bool(getattr(title, "monitored", False))
         toggle = (
@@ -252,8 +240,6 @@ class _SearchKeyboards:
         and here the card that follows carries a delete button, so the guess is
         far more expensive.
         """
-        from bot.ui.callbacks import TitleActionCB
-
         rows = []
         for title in titles[:limit]:
             year = getattr(title, "year", None)
@@ -270,8 +256,6 @@ class _SearchKeyboards:
     @staticmethod
     def confirm_title_delete(title_id: str) -> InlineKeyboardMarkup:
         """Second step of a destructive action — never one tap away."""
-        from bot.ui.callbacks import TitleActionCB
-
         return InlineKeyboardMarkup(inline_keyboard=[
             [InlineKeyboardButton(
                 text="🗑 Да, удалить",
@@ -288,23 +272,21 @@ class _SearchKeyboards:
         may not want, and burns indexer quota on episodes they already have.
         The list is capped — a 30-button wall is not a choice, it's a maze.
         """
-        from bot.ui.callbacks import SeasonScopeCB
-
         rows = [[InlineKeyboardButton(
             text="📺 Весь сериал",
             callback_data=SeasonScopeCB(season=0, title_id=title_id).pack(),
         )]]
 
-        # Newest seasons first: that's what a user is usually after.
-        shown = sorted(seasons, reverse=True)[:12]
-        for i in range(0, len(shown), per_row):
-            rows.append([
-                InlineKeyboardButton(
-                    text=f"S{season:02d}",
-                    callback_data=SeasonScopeCB(season=season, title_id=title_id).pack(),
-                )
-                for season in shown[i:i + per_row]
-            ])
+        # Newest seasons first: that's what a user is usually after. Build the
+        # buttons in one comprehension, then cut them into rows of `per_row`.
+        buttons = [
+            InlineKeyboardButton(
+                text=f"S{season:02d}",
+                callback_data=SeasonScopeCB(season=season, title_id=title_id).pack(),
+            )
+            for season in sorted(seasons, reverse=True)[:12]
+        ]
+        rows.extend(buttons[i:i + per_row] for i in range(0, len(buttons), per_row))
 
-        rows.append([InlineKeyboardButton(text="❌ Отмена", callback_data=CallbackData.CANCEL)])
+        rows.append([_CANCEL_BTN])
         return InlineKeyboardMarkup(inline_keyboard=rows)
@@ -2,12 +2,25 @@
 the settings menu, resolution selection, and the auto-grab toggle.
 """
 
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from bot.models import MetadataProfile, QualityProfile, RootFolder
 from bot.ui.callbacks import SettingCB
+from bot.ui.keyboards._buttons import _SETTINGS_BACK_BTN
 from bot.ui.keyboards._constants import CallbackData
 
+#: Preferred-resolution choices in display order: (label, packed callback).
+#: Both halves are fixed, so the ``SettingCB`` strings are packed once here.
+_RESOLUTIONS = tuple(
+    (label, SettingCB(key="preferred_resolution", value=value).pack())
+    for label, value in (("2160p", "2160p"), ("1080p", "1080p"), ("720p", "720p"), ("Любое", "any"))
+)
+
+#: Resolution buttons per row in ``resolution_selection``.
+_RESOLUTIONS_PER_ROW = 2
+
 
 class _SettingsKeyboards:
     """Settings keyboard mixin."""
@@ -29,9 +42,7 @@ class _SettingsKeyboards:
                 )
             ])
 
-        keyboard.append([
-            InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.SETTINGS),
-        ])
+        keyboard.append([_SETTINGS_BACK_BTN])
 
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
@@ -52,13 +63,12 @@ class _SettingsKeyboards:
                 )
             ])
 
-        keyboard.append([
-            InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.SETTINGS),
-        ])
+        keyboard.append([_SETTINGS_BACK_BTN])
 
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
     @staticmethod
+    @lru_cache
     def settings_menu(lidarr_enabled: bool = False) -> InlineKeyboardMarkup:
         """Create main settings menu keyboard."""
         rows = [
@@ -91,31 +101,26 @@ class _SettingsKeyboards:
                     callback_data=SettingCB(key=key, value=str(profile.id)).pack(),
                 )
             ])
-        keyboard.append([
-            InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.SETTINGS),
-        ])
+        keyboard.append([_SETTINGS_BACK_BTN])
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
     @staticmethod
+    @lru_cache
     def resolution_selection() -> InlineKeyboardMarkup:
         """Create keyboard for selecting preferred resolution."""
-        resolutions = [("2160p", "2160p"), ("1080p", "1080p"), ("720p", "720p"), ("Любое", "any")]
-        keyboard = []
-
-        for i in range(0, len(resolutions), 2):
-            row = []
-            for label, value in resolutions[i:i + 2]:
-                callback = SettingCB(key="preferred_resolution", value=value).pack()
-                row.append(InlineKeyboardButton(text=label, callback_data=callback))
-            keyboard.append(row)
-
-        keyboard.append([
-            InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.SETTINGS),
-        ])
+        keyboard = [
+            [
+                InlineKeyboardButton(text=label, callback_data=callback)
+                for label, callback in _RESOLUTIONS[i:i + _RESOLUTIONS_PER_ROW]
+            ]
+            for i in range(0, len(_RESOLUTIONS), _RESOLUTIONS_PER_ROW)
+        ]
+        keyboard.append([_SETTINGS_BACK_BTN])
 
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
     @staticmethod
+    @lru_cache
     def auto_grab_toggle(current: bool) -> InlineKeyboardMarkup:
         """Create keyboard for toggling auto-grab."""
         current_text = "ВКЛ ✓" if current else "ВЫКЛ"
@@ -129,8 +134,6 @@ class _SettingsKeyboards:
                         callback_data=SettingCB(key="auto_grab_enabled", value=str(new_value)).pack(),
                     ),
                 ],
-                [
-                    InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.SETTINGS),
-                ],
+                [_SETTINGS_BACK_BTN],
             ]
         )
@@ -2,11 +2,87 @@
 speed-limit menu and delete confirmation.
 """
 
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
-from bot.models import TorrentFilter, TorrentInfo
+from bot.models import TorrentFilter, TorrentInfo, TorrentState, format_speed
 from bot.ui.callbacks import TorrentActionCB, TorrentPageCB
+from bot.ui.keyboards._buttons import _TORRENT_BACK_BTN, _nav_row
 from bot.ui.keyboards._constants import CallbackData
+from bot.ui.text import truncate
+
+
+#: Filter picker entries in display order: (filter, label, callback data).
+#: The "t_filter:<value>" strings are fixed, so they are built once here.
+_FILTER_BUTTONS = tuple(
+    (filter_type, label, f"{CallbackData.TORRENT_FILTER}{filter_type.value}")
+    for filter_type, label in (
+        (TorrentFilter.ALL, "📋 Все"),
+        (TorrentFilter.DOWNLOADING, "⬇️ Загрузка"),
+        (TorrentFilter.SEEDING, "⬆️ Раздача"),
+        (TorrentFilter.COMPLETED, "✅ Готово"),
+        (TorrentFilter.PAUSED, "⏸ Пауза"),
+        (TorrentFilter.ACTIVE, "🔥 Активные"),
+        (TorrentFilter.STALLED, "⚠️ Застряли"),
+        (TorrentFilter.ERRORED, "❌ Ошибки"),
+    )
+)
+
+
+#: Speed-limit presets in display order: (limit in bytes/s, label, callback
+#: data per direction). Limits are given in KB/s (0 = unlimited); the byte
+#: value and both "speed:<dir>:<kb>" strings are fixed, so they're built once.
+_SPEED_PRESETS = tuple(
+    (
+        speed_kb * 1024,
+        label,
+        {direction: f"{CallbackData.SPEED_LIMIT}{direction}:{speed_kb}" for direction in ("dl", "ul")},
+    )
+    for speed_kb, label in (
+        (0, "∞ Без лимита"),
+        (512, "512 КБ/с"),
+        (1024, "1 МБ/с"),
+        (2048, "2 МБ/с"),
+        (5120, "5 МБ/с"),
+        (10240, "10 МБ/с"),
+    )
+)
+
+#: Presets per keyboard row — six presets give two rows per direction.
+_SPEED_PRESETS_PER_ROW = 3
+
+#: ``_SPEED_PRESETS`` cut into keyboard rows once; the same rows serve both
+#: directions.
+_SPEED_PRESET_ROWS = tuple(
+    _SPEED_PRESETS[i:i + _SPEED_PRESETS_PER_ROW] for i in range(0, len(_SPEED_PRESETS), _SPEED_PRESETS_PER_ROW)
+)
+
+#: Inert section headers of ``speed_limits_menu``; fixed, so shared.
+_SPEED_DL_HEADER = InlineKeyboardButton(text="⬇️ Лимит загрузки:", callback_data="noop")
+_SPEED_UL_HEADER = InlineKeyboardButton(text="⬆️ Лимит отдачи:", callback_data="noop")
+
+
+@lru_cache(maxsize=512)
+def _torrent_view_callback(torrent_hash: str) -> str:
+    """`TorrentActionCB(action="view", h=...).pack()`, memoised — the list is
+    re-rendered on every refresh/page with mostly the same torrents, and
+    packing validates a pydantic model per button."""
+    return TorrentActionCB(action="view", h=torrent_hash).pack()
+
+
+def _torrent_label(torrent: TorrentInfo) -> str:
+    """Button label for one torrent: emoji, progress %, name, live speed."""
+    # Each speed field is read once and formatted directly, rather than
+    # re-read through the *_speed_formatted properties; idle torrents (the
+    # common case) fall straight through to "".
+    if (dl := torrent.download_speed) > 0:
+        speed = f" ⬇{format_speed(dl)}"
+    elif (ul := torrent.upload_speed) > 0:
+        speed = f" ⬆{format_speed(ul)}"
+    else:
+        speed = ""
+    return truncate(f"{torrent.state_emoji} {torrent.progress_percent}% {truncate(torrent.name, 28)}{speed}", 50)
 
 
 class _TorrentKeyboards:
@@ -25,56 +101,23 @@ class _TorrentKeyboards:
         ``TorrentPageCB`` so paging through a filtered list doesn't silently
         fall back to the unfiltered "all" view.
         """
-        keyboard = []
-
-        # Torrent buttons — torrents is already the page slice
-        for torrent in torrents:
-            # Format: emoji progress% name (speed)
-            progress = f"{torrent.progress_percent}%"
-            speed = ""
-            if torrent.download_speed > 0:
-                speed = f" ⬇{torrent.download_speed_formatted}"
-            elif torrent.upload_speed > 0:
-                speed = f" ⬆{torrent.upload_speed_formatted}"
-
-            name = torrent.name[:25] + "..." if len(torrent.name) > 28 else torrent.name
-            label = f"{torrent.state_emoji} {progress} {name}{speed}"
-            if len(label) > 50:
-                label = label[:47] + "..."
-
-            keyboard.append([
-                InlineKeyboardButton(
-                    text=label,
-                    # PERF-05: full 40-hex hash fits comfortably under the 64-byte
-                    # callback_data limit (worst case "ta:delfc:" + 40 hex = 49
-                    # bytes — see TorrentActionCB), so lookups can use the
-                    # targeted get_torrent(hash) instead of scanning the whole
-                    # list for a short-hash prefix match.
-                    callback_data=TorrentActionCB(action="view", h=torrent.hash).pack(),
-                )
-            ])
+        # Torrent buttons — torrents is already the page slice.
+        # PERF-05: the callback carries the full 40-hex hash, which fits
+        # comfortably under the 64-byte callback_data limit (worst case
+        # "ta:delfc:" + 40 hex = 49 bytes — see TorrentActionCB), so lookups
+        # can use the targeted get_torrent(hash) instead of scanning the whole
+        # list for a short-hash prefix match.
+        keyboard = [
+            [InlineKeyboardButton(text=_torrent_label(torrent), callback_data=_torrent_view_callback(torrent.hash))]
+            for torrent in torrents
+        ]
 
         # Pagination row
         if total_pages > 1:
-            nav_buttons = []
-            if current_page > 0:
-                nav_buttons.append(
-                    InlineKeyboardButton(
-                        text="◀️",
-                        callback_data=TorrentPageCB(page=current_page - 1, flt=current_filter.value).pack(),
-                    )
-                )
-            nav_buttons.append(
-                InlineKeyboardButton(text=f"{current_page + 1}/{total_pages}", callback_data="noop")
+            flt = current_filter.value
+            keyboard.append(
+                _nav_row(current_page, total_pages, lambda page: TorrentPageCB(page=page, flt=flt).pack())
             )
-            if current_page < total_pages - 1:
-                nav_buttons.append(
-                    InlineKeyboardButton(
-                        text="▶️",
-                        callback_data=TorrentPageCB(page=current_page + 1, flt=current_filter.value).pack(),
-                    )
-                )
-            keyboard.append(nav_buttons)
 
         # Filter and action buttons
         keyboard.append([
@@ -82,7 +125,7 @@ class _TorrentKeyboards:
                 text="🔄 Обновить",
                 callback_data=TorrentPageCB(page=current_page, flt=current_filter.value).pack(),
             ),
-            InlineKeyboardButton(text="🔍 Фильтр", callback_data=f"{CallbackData.TORRENT_FILTER}menu"),
+            InlineKeyboardButton(text="🔍 Фильтр", callback_data=CallbackData.TORRENT_FILTER_MENU),
         ])
 
         keyboard.append([
@@ -117,7 +160,6 @@ class _TorrentKeyboards:
         full_hash = torrent.hash
 
         # Pause/Resume based on state
-        from bot.models import TorrentState
         if torrent.state in (TorrentState.PAUSED, TorrentState.QUEUED):
             keyboard.append([
                 InlineKeyboardButton(text="▶️ Возобновить", callback_data=TorrentActionCB(action="resume", h=full_hash).pack()),
@@ -144,31 +186,16 @@ class _TorrentKeyboards:
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
     @staticmethod
+    @lru_cache
     def torrent_filters(current_filter: TorrentFilter = TorrentFilter.ALL) -> InlineKeyboardMarkup:
         """Create keyboard for selecting torrent filter."""
-        filters = [
-            (TorrentFilter.ALL, "📋 Все"),
-            (TorrentFilter.DOWNLOADING, "⬇️ Загрузка"),
-            (TorrentFilter.SEEDING, "⬆️ Раздача"),
-            (TorrentFilter.COMPLETED, "✅ Готово"),
-            (TorrentFilter.PAUSED, "⏸ Пауза"),
-            (TorrentFilter.ACTIVE, "🔥 Активные"),
-            (TorrentFilter.STALLED, "⚠️ Застряли"),
-            (TorrentFilter.ERRORED, "❌ Ошибки"),
-        ]
-
         keyboard = []
         row = []
 
-        for filter_type, label in filters:
+        for filter_type, label, callback in _FILTER_BUTTONS:
             # Mark current filter
             display_label = f"• {label}" if filter_type == current_filter else label
-            row.append(
-                InlineKeyboardButton(
-                    text=display_label,
-                    callback_data=f"{CallbackData.TORRENT_FILTER}{filter_type.value}",
-                )
-            )
+            row.append(InlineKeyboardButton(text=display_label, callback_data=callback))
             if len(row) == 2:
                 keyboard.append(row)
                 row = []
@@ -176,15 +203,13 @@ class _TorrentKeyboards:
         if row:
             keyboard.append(row)
 
-        keyboard.append([
-            InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.TORRENT_BACK),
-        ])
+        keyboard.append([_TORRENT_BACK_BTN])
 
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
     @staticmethod
     def _speed_preset_row(
-        presets: list[tuple[int, str]],
+        presets: tuple[tuple[int, str, dict[str, str]], ...],
         direction: str,
         current_limit: int,
     ) -> list[InlineKeyboardButton]:
@@ -195,16 +220,13 @@ class _TorrentKeyboards:
         "✓ " marker is honest: it compares against the caller-supplied
         ``current_limit`` (bytes/s) instead of always defaulting to 0.
         """
-        row = []
-        for speed_kb, label in presets:
-            marker = "✓ " if current_limit == speed_kb * 1024 else ""
-            row.append(
-                InlineKeyboardButton(
-                    text=f"{marker}{label}",
-                    callback_data=f"{CallbackData.SPEED_LIMIT}{direction}:{speed_kb}",
-                )
+        return [
+            InlineKeyboardButton(
+                text=f"✓ {label}" if current_limit == limit else label,
+                callback_data=callbacks[direction],
             )
-        return row
+            for limit, label, callbacks in presets
+        ]
 
     @staticmethod
     def speed_limits_menu(
@@ -218,24 +240,12 @@ class _TorrentKeyboards:
         always called with the 0/0 defaults, which happened to always match
         the "unlimited" preset regardless of the real setting.
         """
-        # Presets in KB/s (0 = unlimited)
-        presets = [
-            (0, "∞ Без лимита"),
-            (512, "512 КБ/с"),
-            (1024, "1 МБ/с"),
-            (2048, "2 МБ/с"),
-            (5120, "5 МБ/с"),
-            (10240, "10 МБ/с"),
-        ]
-
         keyboard = [
-            [InlineKeyboardButton(text="⬇️ Лимит загрузки:", callback_data="noop")],
-            _TorrentKeyboards._speed_preset_row(presets[:3], "dl", current_dl_limit),
-            _TorrentKeyboards._speed_preset_row(presets[3:], "dl", current_dl_limit),
-            [InlineKeyboardButton(text="⬆️ Лимит отдачи:", callback_data="noop")],
-            _TorrentKeyboards._speed_preset_row(presets[:3], "ul", current_ul_limit),
-            _TorrentKeyboards._speed_preset_row(presets[3:], "ul", current_ul_limit),
-            [InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.TORRENT_BACK)],
+            [_SPEED_DL_HEADER],
+            *(_TorrentKeyboards._speed_preset_row(row, "dl", current_dl_limit) for row in _SPEED_PRESET_ROWS),
+            [_SPEED_UL_HEADER],
+            *(_TorrentKeyboards._speed_preset_row(row, "ul", current_ul_limit) for row in _SPEED_PRESET_ROWS),
+            [_TORRENT_BACK_BTN],
         ]
 
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
@@ -1,11 +1,14 @@
 """Inline keyboards for the TorrServer section."""
 
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 from bot.models import TorrServerRelease, TorrServerTorrent
 from bot.ui.callbacks import TsAddCB, TsPageCB, TsReleaseCB, TsTorrentCB
 from bot.ui.formatters.torrserver import TS_LIST_BUTTON_CAP
+from bot.ui.keyboards._buttons import _TS_BACK_BTN, _nav_row
 from bot.ui.keyboards._constants import CallbackData
 
 
@@ -13,6 +16,7 @@ class _TorrServerKeyboards:
     """TorrServer section keyboards mixin."""
 
     @staticmethod
+    @lru_cache
     def torrserver_panel() -> InlineKeyboardMarkup:
         """Main panel under the status card."""
         return InlineKeyboardMarkup(inline_keyboard=[
@@ -44,20 +48,10 @@ class _TorrServerKeyboards:
                 callback_data=TsReleaseCB(idx=idx).pack(),
             ))
 
-        nav = []
-        if page > 0:
-            nav.append(InlineKeyboardButton(
-                text="⬅️", callback_data=TsPageCB(page=page - 1).pack()))
         if total_pages > 1:
-            nav.append(InlineKeyboardButton(
-                text=f"{page + 1}/{total_pages}", callback_data="noop"))
-        if page < total_pages - 1:
-            nav.append(InlineKeyboardButton(
-                text="➡️", callback_data=TsPageCB(page=page + 1).pack()))
-        if nav:
-            builder.row(*nav)
+            builder.row(*_nav_row(page, total_pages, lambda p: TsPageCB(page=p).pack(), "⬅️", "➡️"))
 
-        builder.row(InlineKeyboardButton(text="⬅️ В меню", callback_data=CallbackData.TS_BACK))
+        builder.row(_TS_BACK_BTN)
         return builder.as_markup()
 
     @staticmethod
@@ -91,7 +85,7 @@ class _TorrServerKeyboards:
                     text=f"🗑 {torrent.title[:35]}",
                     callback_data=TsTorrentCB(action="del", h=torrent.hash).pack(),
                 ))
-        builder.row(InlineKeyboardButton(text="⬅️ В меню", callback_data=CallbackData.TS_BACK))
+        builder.row(_TS_BACK_BTN)
         return builder.as_markup()
 
     @staticmethod
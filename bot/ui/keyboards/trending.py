@@ -7,18 +7,23 @@ directly (rather than through the composed ``Keyboards`` class) avoids a
 circular import between this module and the package ``__init__.py``.
 """
 
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from bot.models import MovieInfo, SeriesInfo
 from bot.ui.callbacks import AddContentCB, TrendingItemCB
+from bot.ui.keyboards._buttons import _TRENDING_BACK_BTN, _TRENDING_MOVIES_BACK_BTN, _TRENDING_SERIES_BACK_BTN
 from bot.ui.keyboards._constants import CallbackData
 from bot.ui.keyboards.search import _SearchKeyboards
+from bot.ui.text import truncate
 
 
 class _TrendingKeyboards:
     """Trending/popular keyboard mixin."""
 
     @staticmethod
+    @lru_cache
     def trending_menu(show_music: bool = False) -> InlineKeyboardMarkup:
         """Create trending/popular content selection menu."""
         rows = [
@@ -38,17 +43,14 @@ class _TrendingKeyboards:
         for i, a in enumerate(artists[:10]):
             name = a.get("name", "Unknown")
             label = f"{i + 1}. {name}"
-            if len(label) > 40:
-                label = label[:37] + "..."
+            label = truncate(label, 40)
             keyboard.append([
                 InlineKeyboardButton(
                     text=label,
                     callback_data=TrendingItemCB(kind="artist", item_id=str(i)).pack(),
                 )
             ])
-        keyboard.append([
-            InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.TRENDING_BACK),
-        ])
+        keyboard.append([_TRENDING_BACK_BTN])
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
     @staticmethod
@@ -67,9 +69,7 @@ class _TrendingKeyboards:
                 )
             ])
 
-        keyboard.append([
-            InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.TRENDING_BACK),
-        ])
+        keyboard.append([_TRENDING_BACK_BTN])
 
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
@@ -89,9 +89,7 @@ class _TrendingKeyboards:
                 )
             ])
 
-        keyboard.append([
-            InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.TRENDING_BACK),
-        ])
+        keyboard.append([_TRENDING_BACK_BTN])
 
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
@@ -108,7 +106,7 @@ class _TrendingKeyboards:
                 callback_data=AddContentCB(kind="movie", tmdb_id=movie.tmdb_id).pack(),
             )
         ])
-        keyboard.append([InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.TRENDING_MOVIES)])
+        keyboard.append([_TRENDING_MOVIES_BACK_BTN])
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
     @staticmethod
@@ -124,5 +122,5 @@ class _TrendingKeyboards:
                 callback_data=AddContentCB(kind="series", tmdb_id=series.tmdb_id).pack(),
             )
         ])
-        keyboard.append([InlineKeyboardButton(text="◀️ Назад", callback_data=CallbackData.TRENDING_SERIES)])
+        keyboard.append([_TRENDING_SERIES_BACK_BTN])
         return InlineKeyboardMarkup(inline_keyboard=keyboard)
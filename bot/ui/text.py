@@ -0,0 +1,19 @@
+"""Plain-text helpers shared by the formatters and the keyboard builders.
+
+Button labels and message bodies cap user-provided strings the same way;
+keeping the helper here (rather than in ``bot/ui/formatters/_common.py``)
+means the keyboards package doesn't reach into the formatters' private
+module for it.
+"""
+
+
+def truncate(text: str, limit: int, suffix: str = "...") -> str:
+    """Cap `text` at `limit` characters, ending in `suffix` when it was cut.
+
+    The suffix counts towards the limit, so a cut string is never longer
+    than one that fits (the old inline ``x[:300] + "..."`` turned a
+    301-char overview into a 303-char one).
+    """
+    if len(text) <= limit:
+        return text
+    return text[: limit - len(suffix)] + suffix
@@ -70,3 +70,7 @@ async def test_publish_failure_does_not_break_startup():
     bot.set_my_commands.side_effect = RuntimeError("Telegram unavailable")
 
     await publish_bot_commands(bot)  # must not raise
+
+
+def test_help_text_is_built_once():
+    assert render_help() is render_help()
@@ -284,3 +284,25 @@ async def test_search_releases_empty_response_returns_empty_list():
     svc.scryer.search_releases = AsyncMock(return_value=[])
     out = await svc.search_releases("title-id", ContentType.MOVIE)
     assert out == []
+
+
+@pytest.mark.parametrize(
+    "query, episodic",
+    [
+        ("Stranger Things S01", True),
+        ("Breaking Bad s01e05", True),
+        ("The Office season 3", True),
+        ("Sherlock series 2", True),
+        ("Friends 1x01", True),
+        ("Friends 1X01", False),  # the NxNN marker was always case-sensitive
+        ("Тьма 2 сезон", True),
+        ("Тьма серия", True),
+        ("Dune 2021", False),
+        ("Sisu", False),
+    ],
+)
+def test_series_marker_regex(query, episodic):
+    """PERF-22 follow-up: the merged alternation keeps every marker's semantics."""
+    from bot.services.search_service import _SERIES_RE
+
+    assert (_SERIES_RE.search(query) is not None) is episodic
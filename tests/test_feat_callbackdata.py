@@ -30,6 +30,19 @@ def test_search_results_nav_uses_typed_pagecb():
     assert got.scope == "search" and got.page == 1  # next page from page 0
 
 
+def test_search_results_labels_have_no_blank_gaps():
+    from bot.models import QualityInfo
+    from bot.ui.keyboards import Keyboards
+
+    results = [
+        SearchResult(guid="a", title="a", quality=QualityInfo(resolution="1080p"), size=2 * 1024**3),
+        SearchResult(guid="b", title="b", seeders=7),
+    ]
+    kb = Keyboards.search_results(results, 0, 1, 5, False, 0)
+    labels = [row[0].text for row in kb.inline_keyboard[:2]]
+    assert labels == ["1. 1080p 2.0 GB", "2. ? S:7"]
+
+
 @pytest.mark.asyncio
 async def test_handle_pagination_reads_callback_data():
     from bot.handlers import search
@@ -103,3 +116,59 @@ def test_torrent_list_pagination_buttons_use_typed_cb():
 
     # Old plain string prefix must no longer be produced.
     assert not any(c.startswith("t_page:") for c in cbs)
+
+
+def test_static_keyboards_are_built_once():
+    """Flag-only builders hand back one shared markup per argument set."""
+    from bot.ui.keyboards import Keyboards
+
+    assert Keyboards.settings_menu() is Keyboards.settings_menu()
+    assert Keyboards.settings_menu(True) is not Keyboards.settings_menu(False)
+    assert Keyboards.resolution_selection() is Keyboards.resolution_selection()
+    assert Keyboards.torrserver_panel() is Keyboards.torrserver_panel()
+    assert Keyboards.main_menu() is Keyboards.main_menu()
+    assert Keyboards.auto_grab_toggle(True) is Keyboards.auto_grab_toggle(True)
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "main_menu",
+        "content_type_selection",
+        "settings_menu",
+        "resolution_selection",
+        "season_presets",
+        "trending_menu",
+        "emby_confirm_restart",
+        "emby_confirm_update",
+        "torrserver_panel",
+        "torrent_filters",
+    ],
+)
+def test_cached_keyboard_equals_fresh_build(name):
+    """A shared markup must be indistinguishable from a freshly built one —
+    guards against a cached instance having been mutated by some caller."""
+    from bot.ui.keyboards import Keyboards
+
+    builder = getattr(Keyboards, name)
+    assert builder() == builder.__wrapped__()
+
+
+def test_memoised_callbacks_match_typed_pack():
+    from bot.ui.callbacks import ReleaseCB, TorrentActionCB
+    from bot.ui.keyboards.search import _release_callback
+    from bot.ui.keyboards.torrent import _torrent_view_callback
+
+    assert _release_callback(12) == ReleaseCB(idx=12).pack()
+    h = "ab" * 20
+    assert _torrent_view_callback(h) == TorrentActionCB(action="view", h=h).pack()
+
+
+def test_torrent_filter_keyboard_is_cached_per_filter():
+    from bot.models import TorrentFilter
+    from bot.ui.keyboards import Keyboards
+
+    seeding = Keyboards.torrent_filters(TorrentFilter.SEEDING)
+    assert Keyboards.torrent_filters(TorrentFilter.SEEDING) is seeding
+    marked = [b.text for row in seeding.inline_keyboard for b in row if b.text.startswith("• ")]
+    assert marked == ["• ⬆️ Раздача"]
@@ -311,6 +311,16 @@ def test_format_search_result_truncates_long_title():
     assert len(out) < 250
 
 
+def test_format_search_result_is_shared_module_function():
+    """The per-result formatter lives at module scope; the Formatters facade
+    exposes the very same function (no wrapper on the page-render path)."""
+    from bot.ui.formatters import search as search_mod
+
+    assert Formatters.format_search_result is search_mod.format_search_result
+    result = SearchResult(guid="g1", title="T", size=1024, seeders=3, calculated_score=7)
+    assert Formatters.format_search_result(result, 2) == search_mod.format_search_result(result, 2)
+
+
 # ---------------------------------------------------------------------------
 # TEST-17: edge cases — emoji/unicode titles, extreme lengths.
 # ---------------------------------------------------------------------------
@@ -331,3 +341,196 @@ def test_format_search_result_handles_unicode_and_long_titles(title):
     out = Formatters.format_search_result(result, 1)
     assert isinstance(out, str)
     assert len(out) < 400
+
+
+def test_torrent_label_tables_cover_every_enum_member():
+    """The hoisted module-level label tables must name every state/filter —
+    a new enum member would otherwise silently fall back to the raw value."""
+    from bot.models import TorrentFilter
+    from bot.ui.formatters import torrent as torrent_mod
+
+    assert {s.value for s in TorrentState} <= set(torrent_mod._STATE_NAMES)
+    assert set(TorrentFilter) <= set(torrent_mod._FILTER_NAMES)
+    assert set(TorrentFilter) - {TorrentFilter.ALL} <= set(torrent_mod._NO_TORRENTS_FILTER_NAMES)
+
+
+@pytest.mark.parametrize(
+    "action,expected",
+    [
+        ("pause", "⏸ Пауза: a&lt;b"),
+        ("delete_files", "🗑 Удалён с файлами: a&lt;b"),
+        ("recheck", "✅ recheck: a&lt;b"),
+    ],
+)
+def test_format_torrent_action_templates(action, expected):
+    assert Formatters.format_torrent_action(action, "a<b") == expected
+
+
+def test_format_user_preferences_matches_ids_across_int_and_str():
+    """Profile/folder lookup is keyed by str(id): a numeric stored preference
+    still finds its profile, and an unset override shows the library default."""
+    from bot.models import QualityProfile, RootFolder, UserPreferences
+
+    profiles = [QualityProfile(id=4, name="UHD"), QualityProfile(id="hd", name="HD")]
+    folders = [RootFolder(id="/media/movies", path="/media/movies")]
+
+    out = Formatters.format_user_preferences(
+        UserPreferences(scryer_quality_profile_id="4"), profiles, folders
+    )
+    assert "Профиль: UHD" in out
+    assert "Папка: По умолчанию" in out
+
+    out = Formatters.format_user_preferences(
+        UserPreferences(scryer_root_folder_id="/media/movies"), profiles, folders
+    )
+    assert "Профиль: По умолчанию" in out
+    assert "Папка: /media/movies" in out
+
+
+@pytest.mark.parametrize(
+    "text,limit,expected",
+    [
+        ("short", 10, "short"),
+        ("exactly10!", 10, "exactly10!"),
+        ("eleven char", 10, "eleven ..."),
+        ("abcdef", 4, "a..."),
+    ],
+)
+def test_truncate_counts_suffix_towards_limit(text, limit, expected):
+    from bot.ui.text import truncate
+
+    out = truncate(text, limit)
+    assert out == expected
+    assert len(out) <= limit
+
+
+def test_content_ratings_are_flattened_for_rating_lookup():
+    """Nested `{"value": x}` ratings are flattened at parse time, so the
+    trending/poster formatters read a plain number in source order."""
+    from bot.models import MovieInfo
+
+    movie = MovieInfo(
+        title="T", ratings={"imdb": {"value": 7.5}, "tmdb": 8, "junk": "n/a"}
+    )
+    assert movie.ratings == {"imdb": 7.5, "tmdb": 8.0}
+    assert Formatters._get_rating(movie.ratings) == 8.0
+    assert "⭐ 8.0/10" in Formatters.format_movie_with_poster(movie)
+
+
+@pytest.mark.parametrize("progress", [-0.5, 0.0, 0.049, 0.05, 0.5, 0.999, 1.0, 1.7])
+def test_progress_bar_is_fixed_width(progress):
+    """Precomputed bars: always `length` cells, out-of-range progress clamped."""
+    bar = Formatters._progress_bar(progress)
+    assert len(bar) == 20
+    assert bar.count("█") == min(max(int(20 * progress), 0), 20)
+    assert len(Formatters._progress_bar(progress, length=10)) == 10
+
+
+@pytest.mark.skipif(not _has_moscow_tz(), reason="IANA tz database not available.")
+def test_format_local_cache_is_keyed_by_timezone(monkeypatch):
+    """Memoised timestamp rendering must not leak across a TIMEZONE change."""
+    from bot.config import get_settings
+    from bot.ui.formatters._common import _format_local
+
+    dt = datetime(2026, 4, 18, 21, 0, tzinfo=timezone.utc)
+
+    monkeypatch.setenv("TIMEZONE", "Europe/Moscow")
+    get_settings.cache_clear()
+    assert _format_local(dt, "%d.%m %H:%M") == "19.04 00:00"
+
+    monkeypatch.setenv("TIMEZONE", "UTC")
+    get_settings.cache_clear()
+    assert _format_local(dt, "%d.%m %H:%M") == "18.04 21:00"
+    # Naive datetimes are UTC, same as _to_local.
+    assert _format_local(dt.replace(tzinfo=None), "%d.%m %H:%M") == "18.04 21:00"
+
+
+def test_release_details_quality_block_follows_field_table():
+    from bot.models import QualityInfo
+    from bot.ui.formatters.search import _QUALITY_DETAIL_LINES
+
+    assert all(attr in QualityInfo.model_fields for attr, _ in _QUALITY_DETAIL_LINES)
+    result = SearchResult(
+        guid="g", title="T", quality=QualityInfo(resolution="2160p", is_remux=True, subtitle="RU")
+    )
+    out = Formatters.format_release_details(result)
+    assert "  • Разрешение: 2160p\n  • 📀 REMUX\n  • 💬 Субтитры: RU\n" in out
+    assert "Кодек" not in out
+
+
+def test_group_by_date_orders_days_and_keeps_input_order_within_a_day():
+    from bot.ui.formatters.calendar import _group_by_date
+
+    items = [
+        {"air_date": "2026-05-02", "n": 1},
+        {"air_date": "2026-05-01", "n": 2},
+        {"air_date": "2026-05-02", "n": 3},
+        {"n": 4},  # no date → sorts last
+    ]
+    grouped = [(key, [i["n"] for i in group]) for key, group in _group_by_date(items, "air_date")]
+    assert grouped == [("2026-05-01", [2]), ("2026-05-02", [1, 3]), ("9999-12-31", [4])]
+
+
+@pytest.mark.parametrize(
+    "dt",
+    [datetime(2026, 1, 2, 3, 4), datetime(2026, 12, 31, 23, 59), datetime(2030, 10, 10, 10, 10)],
+)
+def test_hand_rolled_datetime_formats_match_strftime(dt):
+    from bot.ui.formatters._common import _DT_FORMATTERS
+
+    for fmt, render in _DT_FORMATTERS.items():
+        assert render(dt) == dt.strftime(fmt)
+
+
+def test_date_only_key_is_not_shifted_by_timezone(monkeypatch):
+    """A bare release date is already a calendar day — even west of UTC it
+    must not be converted as "midnight UTC" and land on the previous day."""
+    from bot.config import get_settings
+    from bot.ui.formatters.calendar import _extract_date_key
+
+    monkeypatch.setenv("TIMEZONE", "America/New_York")
+    get_settings.cache_clear()
+    assert _extract_date_key("2026-05-01") == "2026-05-01"
+    assert _extract_date_key("not-a-date") == "not-a-date"
+
+
+@pytest.mark.parametrize("missing", [None, ""])
+def test_missing_date_sorts_last(missing):
+    """Lidarr yields `None` for an album with neither releaseDate nor airDate
+    — it must land in the "no date" bucket, not crash the calendar."""
+    from bot.ui.formatters import Formatters
+    from bot.ui.formatters.calendar import _extract_date_key
+
+    assert _extract_date_key(missing) == "9999-12-31"
+    album = {"artist_name": "A", "title": "T", "release_date": missing}
+    assert "<b>A</b> — T" in Formatters.format_calendar([], [], 7, [album])
+
+
+@pytest.mark.parametrize("digital", [False, True])
+@pytest.mark.parametrize("physical", [False, True])
+@pytest.mark.parametrize("cinemas", [False, True])
+def test_calendar_release_type_suffix(digital, physical, cinemas):
+    movie = {
+        "title": "Film",
+        "release_date": "2026-05-01",
+        "digital_release": "2026-05-01" if digital else None,
+        "physical_release": "2026-06-01" if physical else None,
+        "in_cinemas": "2026-04-01" if cinemas else None,
+    }
+    labels = [
+        label
+        for flag, label in ((digital, "💾 цифровой"), (physical, "📀 физический"), (cinemas, "🎥 кино"))
+        if flag
+    ]
+    suffix = f" [{', '.join(labels)}]" if labels else ""
+    text = Formatters.format_calendar([], [movie])
+    assert f"<b>Film</b>{suffix}\n" in text + "\n"
+
+
+@pytest.mark.parametrize("text", ["Plain Title 2024", "Tom & Jerry", "<b>x</b>", 'say "hi"', "it's", ""])
+def test_e_str_matches_html_escape(text):
+    import html
+
+    from bot.ui.formatters._common import _e_str
+
+    assert _e_str(text) == html.escape(text)
@@ -113,6 +113,27 @@ class TestScoringService:
 
         assert score_dv > score_hdr
 
+    @pytest.mark.parametrize(
+        "hdr, weight",
+        [
+            ("DV", "hdr_dolby_vision"),
+            ("DV+HDR10+", "hdr_dolby_vision"),
+            ("HDR10+DV", "hdr_dolby_vision"),
+            ("HDR10+", "hdr_hdr10plus"),
+            ("HDR10", "hdr_hdr10"),
+            ("HDR", "hdr_hdr10"),
+        ],
+    )
+    def test_hdr_tiers_are_mutually_exclusive(self, scoring_service, base_result, hdr, weight):
+        """Each HDR value earns exactly one tier bonus, and the highest tier wins."""
+        base_result.quality.hdr = None
+        score_none = scoring_service.calculate_score(base_result)
+
+        base_result.quality.hdr = hdr
+        score = scoring_service.calculate_score(base_result)
+
+        assert score - score_none == getattr(scoring_service.weights, weight)
+
     def test_seeder_bonus(self, scoring_service, base_result):
         """Test seeder bonus."""
         base_result.seeders = 100
@@ -400,3 +421,31 @@ class TestScoringWeights:
         score_clean = service.calculate_score(result_clean)
 
         assert score < score_clean
+
+    def test_weights_are_frozen_and_slotted(self):
+        """Weights are immutable once built, so the compiled patterns can't go stale."""
+        import dataclasses
+
+        weights = ScoringWeights(bad_keywords={"badword": -100})
+
+        assert not hasattr(weights, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            weights.resolution_1080p = 99
+        with pytest.raises(TypeError):
+            weights.bad_keywords["other"] = -5
+        assert [p for _, p in weights._bad_keyword_patterns] == [-100]
+        # Frozen implies hashable; the mapping field must not break hash().
+        assert hash(weights) == hash(ScoringWeights(bad_keywords={"badword": -100}))
+
+    def test_weights_survive_deepcopy_and_pickle(self):
+        """The read-only keyword mapping must not make weights uncopyable."""
+        import copy
+        import pickle
+
+        weights = ScoringWeights(resolution_1080p=7, bad_keywords={"badword": -100})
+
+        for clone in (copy.deepcopy(weights), pickle.loads(pickle.dumps(weights))):
+            assert clone == weights
+            assert clone.resolution_1080p == 7
+            assert dict(clone.bad_keywords) == {"badword": -100}
+            assert [p for _, p in clone._bad_keyword_patterns] == [-100]